@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 본문 보강
+- 원문 기사 페이지(originallink)에서 제목/요약/이미지(OG 메타데이터) 추출
+- 제한된 작업자 수로 동시 수집, 호스트별 요청 간격 제한
+- URL 기준 디스크 캐시로 같은 기사는 다시 받지 않음
+"""
+
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+
+import requests
+
+# 페이지에서 읽을 최대 바이트 (메타데이터는 <head>에 있으므로 앞부분만 읽음)
+MAX_PAGE_BYTES = 256 * 1024
+
+CHARSET_PATTERN = re.compile(rb'charset=["\']?([A-Za-z0-9_\-]+)', re.IGNORECASE)
+
+# 캐시 보존 기간 (초) - 성공한 결과는 7일, 실패한 결과는 10분 뒤 다시 시도
+CACHE_TTL = 7 * 24 * 3600
+FAILURE_TTL = 10 * 60
+
+
+class _HeadDone(Exception):
+    """<head>를 다 읽어 파싱을 멈출 때 사용"""
+
+
+class MetaParser(HTMLParser):
+    """<title>과 OG/description 메타 태그만 추출하는 파서"""
+
+    def __init__(self):
+        super().__init__()
+        self.meta = {}
+        self.title = ""
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title":
+            self._in_title = True
+        elif tag == "meta":
+            attrs = dict(attrs)
+            key = (attrs.get("property") or attrs.get("name") or "").lower()
+            content = attrs.get("content")
+            if key and content and key not in self.meta:
+                self.meta[key] = content.strip()
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        elif tag == "head":
+            # 본문은 필요 없으므로 파싱 중단
+            raise _HeadDone
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+
+
+class ArticleEnricher:
+    def __init__(self, cache_file, max_workers=8, per_host_interval=0.5, timeout=5, log=print):
+        self.cache_file = cache_file
+        self.max_workers = max_workers
+        self.per_host_interval = per_host_interval
+        self.timeout = timeout
+        self.log = log
+
+        # 호스트별 다음 요청 가능 시각
+        self.host_next_time = {}
+        self.host_lock = threading.Lock()
+
+        # URL → 추출 결과 캐시 (변경된 경우에만 저장)
+        self.cache = {}
+        self.cache_dirty = False
+        self.cache_lock = threading.Lock()
+        self.load_cache()
+
+    def load_cache(self):
+        """디스크 캐시 로드 (만료된 항목 제외)"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self.cache = json.load(f)
+                self.prune_cache()
+        except Exception as e:
+            self.log(f"본문 캐시 로드 오류: {str(e)}")
+            self.cache = {}
+
+    def is_expired(self, entry, now):
+        """캐시 항목 만료 여부 (실패한 결과는 짧게 보존)"""
+        ttl = FAILURE_TTL if entry.get("failed") else CACHE_TTL
+        return now - entry.get("fetched_at", 0) > ttl
+
+    def prune_cache(self):
+        """만료된 캐시 항목 삭제"""
+        now = time.time()
+        with self.cache_lock:
+            expired = [url for url, entry in self.cache.items() if self.is_expired(entry, now)]
+            for url in expired:
+                del self.cache[url]
+            if expired:
+                self.cache_dirty = True
+
+    def save_cache(self):
+        """디스크 캐시 저장 (변경된 경우에만, 임시 파일에 쓴 뒤 교체)"""
+        self.prune_cache()
+        try:
+            with self.cache_lock:
+                if not self.cache_dirty:
+                    return
+                data = json.dumps(self.cache, ensure_ascii=False)
+                self.cache_dirty = False
+            tmp_file = self.cache_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            self.log(f"본문 캐시 저장 오류: {str(e)}")
+
+    def wait_for_host(self, url):
+        """같은 호스트에 per_host_interval초 간격으로만 요청하도록 대기"""
+        host = urllib.parse.urlsplit(url).netloc
+        with self.host_lock:
+            now = time.monotonic()
+            start = max(now, self.host_next_time.get(host, 0))
+            self.host_next_time[host] = start + self.per_host_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def decode_page(self, response, raw):
+        """응답 헤더 또는 <meta charset>으로 인코딩을 판단하여 디코딩"""
+        encoding = None
+        if "charset" in response.headers.get("Content-Type", "").lower():
+            encoding = response.encoding
+        if not encoding:
+            match = CHARSET_PATTERN.search(raw[:4096])
+            encoding = match.group(1).decode("ascii") if match else "utf-8"
+        try:
+            return raw.decode(encoding, errors="replace")
+        except LookupError:
+            return raw.decode("utf-8", errors="replace")
+
+    def fetch_metadata(self, url):
+        """기사 페이지에서 제목/요약/이미지 추출 (실패 시 None)"""
+        try:
+            self.wait_for_host(url)
+            with requests.get(url, timeout=self.timeout, stream=True,
+                              headers={"User-Agent": "Mozilla/5.0"}) as response:
+                if response.status_code != 200:
+                    self.log(f"본문 수집 실패 ({url}): HTTP {response.status_code}")
+                    return None
+                raw = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
+
+            parser = MetaParser()
+            try:
+                parser.feed(self.decode_page(response, raw))
+            except _HeadDone:
+                pass
+
+            meta = parser.meta
+            return {
+                "title": meta.get("og:title") or parser.title.strip(),
+                "summary": meta.get("og:description") or meta.get("description", ""),
+                "image": meta.get("og:image", "")
+            }
+        except Exception as e:
+            self.log(f"본문 수집 오류 ({url}): {str(e)}")
+            return None
+
+    def get_metadata(self, url):
+        """캐시를 먼저 확인하고 없거나 만료되었으면 수집"""
+        now = time.time()
+        with self.cache_lock:
+            cached = self.cache.get(url)
+        if cached is not None and not self.is_expired(cached, now):
+            return cached
+
+        result = self.fetch_metadata(url)
+        if result is None:
+            # 실패도 잠시 기록하여 매 작업마다 같은 페이지를 다시 요청하지 않도록 함
+            result = {"title": "", "summary": "", "image": "", "failed": True}
+        result["fetched_at"] = int(now)
+        with self.cache_lock:
+            self.cache[url] = result
+            self.cache_dirty = True
+        return result
+
+    def enrich(self, news_list):
+        """뉴스 목록에 원문 요약/이미지 추가 (news 딕셔너리를 직접 갱신)"""
+        targets = [news for news in news_list if news.get("originallink") or news.get("link")]
+        if not targets:
+            return news_list
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            urls = [news.get("originallink") or news["link"] for news in targets]
+            for news, meta in zip(targets, executor.map(self.get_metadata, urls)):
+                news["summary"] = meta.get("summary", "")
+                news["image"] = meta.get("image", "")
+                # 네이버 description보다 원문 요약이 길면 점수 계산에 원문 요약 사용
+                if len(news["summary"]) > len(news.get("description", "")):
+                    news["description"] = news["summary"]
+
+        self.save_cache()
+        return news_list
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+회로 차단기
+- 연속 실패가 일정 횟수를 넘으면 호출을 차단(open)하여 쿼터와 스레드 낭비 방지
+- 대기 시간이 지나면 한 번만 시험 호출(half-open), 성공하면 정상(closed)으로 복귀
+- 시험 호출이 실패하면 대기 시간을 두 배로 늘림 (최대값까지)
+"""
+
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+STATE_LABELS = {CLOSED: "정상", OPEN: "차단", HALF_OPEN: "확인 중"}
+
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=3, reset_timeout=60, max_reset_timeout=600,
+                 clock=time.time, log=print):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.clock = clock
+        self.log = log
+
+        self.lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+        # 측정값
+        self.total_calls = 0
+        self.total_failures = 0
+        self.rejected_calls = 0
+        self.last_error = ""
+
+    def allow(self):
+        """호출 가능 여부 (차단 중이면 False, 대기 시간이 지났으면 시험 호출 1회 허용)"""
+        with self.lock:
+            self._check_timeout()
+
+            if self.state == CLOSED or (self.state == HALF_OPEN and not self.probe_in_flight):
+                if self.state == HALF_OPEN:
+                    self.probe_in_flight = True
+                self.total_calls += 1
+                return True
+
+            self.rejected_calls += 1
+            return False
+
+    def refresh(self):
+        """호출이 없어도 대기 시간이 지났으면 시험 호출 대기(half-open)로 전환 (상태 표시용)"""
+        with self.lock:
+            self._check_timeout()
+
+    def _check_timeout(self):
+        if self.state == OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+            self._set_state(HALF_OPEN)
+
+    def cancel(self):
+        """allow()로 허용받았지만 호출하지 않은 경우 (결과를 기록하지 않고 시험 호출 자리 반환)"""
+        with self.lock:
+            self.probe_in_flight = False
+            self.total_calls -= 1
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.probe_in_flight = False
+            self.reset_timeout = self.base_reset_timeout
+            if self.state != CLOSED:
+                self._set_state(CLOSED)
+
+    def record_failure(self, error=""):
+        with self.lock:
+            self.failures += 1
+            self.total_failures += 1
+            self.last_error = error
+            self.probe_in_flight = False
+
+            if self.state == HALF_OPEN:
+                # 시험 호출 실패: 대기 시간을 늘려 다시 차단
+                self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+                self._open()
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.opened_at = self.clock()
+        self._set_state(OPEN)
+
+    def _set_state(self, state):
+        if state != self.state:
+            self.state = state
+            message = f"{self.name}: {STATE_LABELS[state]}"
+            if state == OPEN:
+                message += f" ({int(self.reset_timeout)}초 후 재시도, 원인: {self.last_error})"
+            self.log(message)
+
+    def retry_in(self):
+        """차단 해제(시험 호출)까지 남은 초"""
+        if self.state != OPEN:
+            return 0
+        return max(int(self.reset_timeout - (self.clock() - self.opened_at)), 0)
+
+    def status_text(self):
+        if self.state == OPEN:
+            return f"{self.name}: 차단({self.retry_in()}초)"
+        return f"{self.name}: {STATE_LABELS[self.state]}"
+
+    def snapshot(self):
+        """상태 및 측정값"""
+        return {
+            "name": self.name,
+            "state": self.state,
+            "calls": self.total_calls,
+            "failures": self.total_failures,
+            "rejected": self.rejected_calls,
+            "last_error": self.last_error
+        }
+
+
+class CircuitBreakerRegistry:
+    """이름별 회로 차단기 모음 (엔드포인트, 검색어 등)"""
+
+    def __init__(self, clock=time.time, log=print, **options):
+        self.clock = clock
+        self.log = log
+        self.options = options
+        self.breakers = {}
+        self.lock = threading.Lock()
+
+    def get(self, name):
+        with self.lock:
+            if name not in self.breakers:
+                self.breakers[name] = CircuitBreaker(name, clock=self.clock, log=self.log, **self.options)
+            return self.breakers[name]
+
+    def all(self):
+        with self.lock:
+            return list(self.breakers.values())
@@ -3,6 +3,7 @@
 """
 API 키 설정 GUI
 - 네이버, 카카오 API 키를 입력하여 keys.txt에 저장
+- 단독 실행 또는 메인 앱 안에서 Toplevel 창으로 실행
 """
 
 import tkinter as tk
@@ -10,8 +11,11 @@ from tkinter import ttk, messagebox
 import os
 
 class KeySetupGUI:
-    def __init__(self):
-        self.root = tk.Tk()
+    def __init__(self, master=None, on_save=None):
+        # master가 있으면 메인 앱과 같은 프로세스의 Toplevel 창으로 생성
+        self.master = master
+        self.on_save = on_save  # 저장 후 호출 (메인 앱 키 즉시 다시 로드)
+        self.root = tk.Toplevel(master) if master else tk.Tk()
         self.root.title("🔑 API 키 설정")
         self.root.geometry("450x400")
         self.root.resizable(True, True)
@@ -54,10 +58,14 @@ class KeySetupGUI:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # 마우스 휠 바인딩
+        # 마우스 휠 바인딩 (Toplevel일 때는 메인 창 바인딩을 덮어쓰지 않도록 이 창에만)
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            return "break"  # 메인 창 스크롤로 전달되지 않도록
+        if self.master:
+            self.root.bind("<MouseWheel>", _on_mousewheel)
+        else:
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
         
         # 제목
         title_label = ttk.Label(main_frame, text="🔑 API 키 설정", font=("Arial", 16, "bold"))
@@ -79,13 +87,22 @@ class KeySetupGUI:
         
         # 카카오 API 키 섹션
         kakao_frame = ttk.LabelFrame(main_frame, text="카카오톡 API", padding="15")
-        kakao_frame.pack(fill=tk.X, pady=(0, 20))
+        kakao_frame.pack(fill=tk.X, pady=(0, 15))
         
         ttk.Label(kakao_frame, text="REST API Key:").pack(anchor=tk.W)
         self.kakao_key_var = tk.StringVar()
         kakao_key_entry = ttk.Entry(kakao_frame, textvariable=self.kakao_key_var, width=50)
         kakao_key_entry.pack(fill=tk.X, pady=(5, 0))
         
+        # 웹훅 섹션 (선택)
+        webhook_frame = ttk.LabelFrame(main_frame, text="웹훅 (선택)", padding="15")
+        webhook_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        ttk.Label(webhook_frame, text="Webhook URL:").pack(anchor=tk.W)
+        self.webhook_url_var = tk.StringVar()
+        webhook_url_entry = ttk.Entry(webhook_frame, textvariable=self.webhook_url_var, width=50)
+        webhook_url_entry.pack(fill=tk.X, pady=(5, 0))
+        
         # 안내 메시지
         info_frame = ttk.Frame(main_frame)
         info_frame.pack(fill=tk.X, pady=(0, 20))
@@ -119,6 +136,8 @@ class KeySetupGUI:
                         self.naver_secret_var.set(line.split('=', 1)[1].strip())
                     elif line.startswith('KAKAO_KEY='):
                         self.kakao_key_var.set(line.split('=', 1)[1].strip())
+                    elif line.startswith('WEBHOOK_URL='):
+                        self.webhook_url_var.set(line.split('=', 1)[1].strip())
         except Exception as e:
             print(f"키 파일 로드 오류: {str(e)}")
     
@@ -127,15 +146,15 @@ class KeySetupGUI:
         try:
             # 입력 검증
             if not self.naver_id_var.get().strip():
-                messagebox.showwarning("경고", "네이버 Client ID를 입력해주세요.")
+                messagebox.showwarning("경고", "네이버 Client ID를 입력해주세요.", parent=self.root)
                 return
             
             if not self.naver_secret_var.get().strip():
-                messagebox.showwarning("경고", "네이버 Client Secret을 입력해주세요.")
+                messagebox.showwarning("경고", "네이버 Client Secret을 입력해주세요.", parent=self.root)
                 return
                 
             if not self.kakao_key_var.get().strip():
-                messagebox.showwarning("경고", "카카오 REST API Key를 입력해주세요.")
+                messagebox.showwarning("경고", "카카오 REST API Key를 입력해주세요.", parent=self.root)
                 return
             
             # 키 파일에 저장
@@ -143,11 +162,15 @@ class KeySetupGUI:
                 f.write(f"NAVER_ID={self.naver_id_var.get().strip()}\n")
                 f.write(f"NAVER_SECRET={self.naver_secret_var.get().strip()}\n")
                 f.write(f"KAKAO_KEY={self.kakao_key_var.get().strip()}\n")
+                f.write(f"WEBHOOK_URL={self.webhook_url_var.get().strip()}\n")
+            
+            if self.on_save:
+                self.on_save()
             
-            messagebox.showinfo("성공", "API 키가 저장되었습니다!")
+            messagebox.showinfo("성공", "API 키가 저장되었습니다!", parent=self.root)
             
         except Exception as e:
-            messagebox.showerror("오류", f"키 저장 중 오류가 발생했습니다: {str(e)}")
+            messagebox.showerror("오류", f"키 저장 중 오류가 발생했습니다: {str(e)}", parent=self.root)
     
     def run(self):
         """GUI 실행"""
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 색인
+- 한글은 음절 단위 1-gram/2-gram, 영문/숫자는 단어 단위로 토큰화 (외부 형태소 분석기 없음)
+- 가져온 뉴스 묶음에 대한 역색인으로 키워드 검색 시 전체 기사를 훑지 않음
+- 포함/제외 키워드 규칙 평가 (예: "경제, 주식, +코스피, -연예")
+"""
+
+import re
+import unicodedata
+
+TOKEN_PATTERN = re.compile(r'[가-힣]+|[A-Za-z]+|[0-9]+')
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+
+
+def normalize(text):
+    """자모가 분리된(NFD) 한글을 완성형으로 합침"""
+    return unicodedata.normalize('NFC', text)
+
+
+def is_acronym(word):
+    """대문자 약어 (IT, AI 등) - 대소문자를 구분하여 영어 단어 it 등과 구별"""
+    return len(word) > 1 and word.isascii() and word.isupper()
+
+
+def word_tokens(word):
+    """단어 하나의 토큰 (한글: 음절 1-gram + 2-gram, 영문: 소문자 단어 + 약어, 숫자: 단어 자체)"""
+    if HANGUL_PATTERN.match(word):
+        tokens = list(word)
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        return tokens
+    if is_acronym(word):
+        return [word.lower(), "=" + word]
+    return [word.lower()]
+
+
+def tokenize(text):
+    """문서 토큰 집합"""
+    tokens = set()
+    for word in TOKEN_PATTERN.findall(normalize(text)):
+        tokens.update(word_tokens(word))
+    return tokens
+
+
+def query_tokens(keyword):
+    """키워드 검색에 필요한 최소 토큰 (한글 2음절 이상은 2-gram만, 약어는 대소문자 구분)"""
+    tokens = []
+    for word in TOKEN_PATTERN.findall(keyword):
+        if HANGUL_PATTERN.match(word) and len(word) >= 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        elif is_acronym(word):
+            tokens.append("=" + word)
+        else:
+            tokens.append(word.lower())
+    return tokens
+
+
+class InvertedIndex:
+    def __init__(self, docs, fields=("title", "description")):
+        self.fields = fields
+        self.size = len(docs)
+        # 필드별 토큰 → 기사 번호 집합, 구절 확인용 소문자 원문
+        self.postings = {field: {} for field in fields}
+        self.texts = {field: [] for field in fields}
+        for field in fields:
+            postings = self.postings[field]
+            for doc_id, doc in enumerate(docs):
+                text = normalize(doc.get(field, ""))
+                self.texts[field].append(text.lower())
+                for token in tokenize(text):
+                    postings.setdefault(token, set()).add(doc_id)
+
+    def lookup(self, keyword, field=None):
+        """키워드를 포함한 기사 번호 집합 (field를 지정하지 않으면 모든 필드)"""
+        keyword = normalize(keyword.strip())
+        tokens = query_tokens(keyword)
+        if not tokens:
+            return set()
+
+        words = TOKEN_PATTERN.findall(keyword)
+        phrase = keyword.lower()
+        # 여러 단어이거나 3음절 이상 한글이면 2-gram이 떨어져 있을 수 있으므로 원문에서 확인
+        needs_verify = len(words) > 1 or any(HANGUL_PATTERN.match(word) and len(word) >= 3 for word in words)
+
+        result = set()
+        for name in ([field] if field else self.fields):
+            postings = self.postings[name]
+            # 기사 수가 적은 토큰부터 교집합
+            lists = sorted((postings.get(token, set()) for token in set(tokens)), key=len)
+            if not lists[0]:
+                continue
+            candidates = set(lists[0])
+            for posting in lists[1:]:
+                candidates &= posting
+                if not candidates:
+                    break
+
+            if needs_verify:
+                texts = self.texts[name]
+                candidates = {doc_id for doc_id in candidates if phrase in texts[doc_id]}
+            result |= candidates
+        return result
+
+    def evaluate(self, rule):
+        """규칙에 맞는 기사 번호 집합"""
+        if rule.any_of:
+            matched = set()
+            for keyword in rule.any_of:
+                matched |= self.lookup(keyword)
+        else:
+            matched = set(range(self.size))
+
+        for keyword in rule.all_of:
+            if not matched:
+                break
+            matched &= self.lookup(keyword)
+
+        for keyword in rule.none_of:
+            if not matched:
+                break
+            matched -= self.lookup(keyword)
+        return matched
+
+
+class KeywordRule:
+    """포함/제외 키워드 규칙 (쉼표 구분, 일반: 하나 이상 포함, +: 반드시 포함, -: 제외)"""
+
+    def __init__(self, any_of=(), all_of=(), none_of=()):
+        self.any_of = list(any_of)
+        self.all_of = list(all_of)
+        self.none_of = list(none_of)
+
+    @classmethod
+    def parse(cls, text):
+        rule = cls()
+        for term in text.split(","):
+            term = term.strip()
+            sign = term[0] if term.startswith(("+", "-")) else ""
+            keyword = term[len(sign):].strip()
+            # 기호만 있는 항목(-, + 등)은 검색할 토큰이 없어 전체 기사를 걸러내므로 무시
+            if not query_tokens(normalize(keyword)):
+                continue
+            if sign == "-":
+                rule.none_of.append(keyword)
+            elif sign == "+":
+                rule.all_of.append(keyword)
+            else:
+                rule.any_of.append(keyword)
+        return rule
+
+    def is_empty(self):
+        return not (self.any_of or self.all_of or self.none_of)
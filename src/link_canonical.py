@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 링크 정규화
+- 같은 네이버 기사를 가리키는 여러 형태의 URL을 (oid, aid) 기준 하나의 키로 통일
+- 추적용 파라미터(utm_* 등) 제거 후 중복/전송 여부 판단에 사용
+"""
+
+import re
+import urllib.parse
+
+# n.news.naver.com/mnews/article/001/0012345678, n.news.naver.com/article/001/0012345678,
+# n.news.naver.com/mnews/hotissue/article/001/0012345678 등
+NAVER_ARTICLE_PATH = re.compile(r'/article/(\d+)/(\d+)')
+
+# 추적/공유용 파라미터 (기사 내용과 무관, utm_*는 별도 처리)
+TRACKING_PARAMS = {'fbclid', 'gclid', 'igshid', 'mc_cid', 'mc_eid', 'ref_src'}
+
+
+def canonical_link(link):
+    """링크를 정규화된 키로 변환 (네이버 기사는 'naver:oid/aid')"""
+    link = link.strip()
+    if not link or link.startswith('naver:'):
+        # 빈 링크이거나 이미 정규화된 키
+        return link
+
+    try:
+        parts = urllib.parse.urlsplit(link)
+    except ValueError:
+        return link
+
+    host = parts.netloc.lower()
+    if host.endswith(':80') or host.endswith(':443'):
+        host = host.rsplit(':', 1)[0]
+    query = urllib.parse.parse_qsl(parts.query, keep_blank_values=False)
+
+    if host == 'naver.com' or host.endswith('.naver.com'):
+        # 경로형 (n.news.naver.com/mnews/article/oid/aid)
+        match = NAVER_ARTICLE_PATH.search(parts.path)
+        if match:
+            return f"naver:{match.group(1)}/{match.group(2)}"
+
+        # 쿼리형 (news.naver.com/main/read.naver?oid=&aid=, read.nhn, sports/entertain 등)
+        params = dict(query)
+        if params.get('oid') and params.get('aid'):
+            return f"naver:{params['oid']}/{params['aid']}"
+
+    # 일반 기사: www. 제거, 추적 파라미터 제거, 파라미터 정렬, 프래그먼트 제거
+    if host.startswith('www.'):
+        host = host[4:]
+    query = sorted((key, value) for key, value in query
+                   if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_'))
+    path = parts.path.rstrip('/') or '/'
+    key = host + path
+    if query:
+        key += '?' + urllib.parse.urlencode(query)
+    return key
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+알림 전송 채널
+- 카카오톡 나에게 보내기(텍스트/리스트 템플릿), 웹훅, 파일/표준출력(테스트용) 채널
+- 채널별 동시 전송 수와 최소 전송 간격 제한
+- 여러 채널에 병렬로 전송하여 느린 채널이 다른 채널을 지연시키지 않음
+"""
+
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+
+KAKAO_MEMO_URL = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
+
+
+class NotificationSink:
+    """전송 채널 기본 클래스 (deliver만 구현하면 됨)"""
+
+    name = "sink"
+    max_items = 5  # 메시지 하나에 담을 최대 기사 수
+
+    def __init__(self, max_concurrency=1, min_interval=0.0, breaker=None, required=False, log=print):
+        self.breaker = breaker  # 회로 차단기 (연속 실패 시 전송 중단)
+        self.required = required  # 필수 채널 (실패하면 전체 전송 실패로 처리)
+        self.max_concurrency = max_concurrency
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self.min_interval = min_interval
+        self.next_time = 0.0
+        self.rate_lock = threading.Lock()
+        self.log = log
+
+    def wait_for_rate_limit(self):
+        """직전 전송 후 min_interval초가 지날 때까지 대기"""
+        with self.rate_lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def send(self, message, news_list):
+        """동시성/전송 간격 제한을 지켜 전송 (성공 여부 반환)"""
+        if self.breaker and not self.breaker.allow():
+            self.log(f"{self.name} 일시 차단 중 ({self.breaker.retry_in()}초 후 재시도)")
+            return False
+
+        with self.semaphore:
+            self.wait_for_rate_limit()
+            try:
+                ok = self.deliver(message, news_list)
+                error = "전송 실패"
+            except Exception as e:
+                self.log(f"{self.name} 전송 오류: {str(e)}")
+                ok, error = False, str(e)
+
+        if self.breaker:
+            if ok:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure(error)
+        return ok
+
+    def deliver(self, message, news_list):
+        raise NotImplementedError
+
+
+class KakaoMemoSink(NotificationSink):
+    """카카오톡 나에게 보내기 - 텍스트 템플릿"""
+
+    name = "카카오톡"
+
+    def __init__(self, token_getter, **kwargs):
+        super().__init__(**kwargs)
+        self.token_getter = token_getter  # 토큰이 갱신될 수 있으므로 전송 시점에 조회
+
+    def build_template(self, message, news_list):
+        return {
+            'object_type': 'text',
+            'text': message,
+            'link': {
+                'web_url': 'https://news.naver.com',
+                'mobile_web_url': 'https://news.naver.com'
+            }
+        }
+
+    def deliver(self, message, news_list):
+        access_token = self.token_getter()
+        if not access_token:
+            return False
+
+        import requests
+
+        headers = {
+            'Authorization': f'Bearer {access_token}',
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
+        data = {'template_object': json.dumps(self.build_template(message, news_list))}
+        response = requests.post(KAKAO_MEMO_URL, headers=headers, data=data, timeout=10)
+        return response.status_code == 200
+
+
+class KakaoListSink(KakaoMemoSink):
+    """카카오톡 나에게 보내기 - 리스트 템플릿 (기사별 링크, 최대 3개)"""
+
+    name = "카카오톡(리스트)"
+    max_items = 3
+
+    def build_template(self, message, news_list):
+        if len(news_list) < 2:
+            # 리스트 템플릿은 2~3개 항목이 필요하므로 그보다 적으면 텍스트로 전송
+            return super().build_template(message, news_list)
+
+        contents = []
+        for news in news_list[:self.max_items]:
+            content = {
+                'title': news['title'],
+                'description': news.get('description', '')[:50],
+                'link': {'web_url': news['link'], 'mobile_web_url': news['link']}
+            }
+            if news.get('image'):
+                content['image_url'] = news['image']
+            contents.append(content)
+        return {
+            'object_type': 'list',
+            'header_title': message.split('\n', 1)[0],
+            'header_link': {
+                'web_url': 'https://news.naver.com',
+                'mobile_web_url': 'https://news.naver.com'
+            },
+            'contents': contents
+        }
+
+
+class WebhookSink(NotificationSink):
+    """웹훅 - 메시지와 기사 목록을 JSON으로 POST"""
+
+    name = "웹훅"
+
+    def __init__(self, url, **kwargs):
+        super().__init__(**kwargs)
+        self.url = url
+
+    def deliver(self, message, news_list):
+        import requests
+
+        payload = {
+            'text': message,
+            'news': [{'title': news['title'], 'link': news['link']} for news in news_list]
+        }
+        response = requests.post(self.url, json=payload, timeout=10)
+        return 200 <= response.status_code < 300
+
+
+class StubSink(NotificationSink):
+    """파일/표준출력 기록 - 다른 채널과 함께 전송 내용을 남기거나 재생 시뮬레이션에서 전송 대신 사용"""
+
+    name = "기록"
+
+    def __init__(self, path="-", clock=time.time, keep_deliveries=False, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path  # "-"이면 표준출력, None이면 출력하지 않음
+        self.clock = clock  # 전송 시각 (시뮬레이션에서는 가상 시각)
+        self.keep_deliveries = keep_deliveries  # True면 (전송 시각, 기사 목록)을 deliveries에 보관
+        self.deliveries = []
+        self.sent_count = 0
+        self.write_lock = threading.Lock()
+
+    def deliver(self, message, news_list):
+        sent_at = self.clock()
+        entry = f"[{datetime.fromtimestamp(sent_at).isoformat(timespec='seconds')}] {len(news_list)}개\n{message}\n"
+        with self.write_lock:
+            if self.path == "-":
+                sys.stdout.write(entry)
+            elif self.path:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(entry)
+            if self.keep_deliveries:
+                self.deliveries.append((sent_at, list(news_list)))
+            self.sent_count += 1
+        return True
+
+
+class SinkDispatcher:
+    """여러 채널에 병렬 전송"""
+
+    def __init__(self, sinks, timeout=30, log=print):
+        self.sinks = list(sinks)
+        self.timeout = timeout
+        self.log = log
+        # 채널별 동시 전송 수만큼 작업자를 두어 한 채널이 다른 채널의 작업자를 점유하지 않도록 함
+        self.executor = ThreadPoolExecutor(max_workers=max(sum(sink.max_concurrency for sink in self.sinks), 1))
+        # 모든 채널이 한 메시지에 담을 수 있는 기사 수
+        self.max_items = min((sink.max_items for sink in self.sinks), default=NotificationSink.max_items)
+
+    def dispatch(self, message, news_list=()):
+        """모든 채널에 전송하고 {채널 이름: 성공 여부} 반환"""
+        news_list = list(news_list)
+        futures = {self.executor.submit(sink.send, message, news_list): sink for sink in self.sinks}
+        done, _ = wait(futures, timeout=self.timeout)
+
+        results = {}
+        for future, sink in futures.items():
+            if future in done:
+                results[sink.name] = future.result()
+            else:
+                self.log(f"{sink.name} 전송 시간 초과")
+                results[sink.name] = False
+        return results
+
+    def succeeded(self, results):
+        """필수 채널이 모두 성공했는지 (필수 채널이 없으면 하나라도 성공했는지)"""
+        required = [sink.name for sink in self.sinks if sink.required]
+        if required:
+            return all(results.get(name) for name in required)
+        return any(results.values())
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
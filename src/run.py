@@ -8,17 +8,63 @@
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, simpledialog
+from tkinter import ttk, messagebox, scrolledtext
 import threading
 import time
-import schedule
-import requests
 import json
-import webbrowser
-import urllib.parse
 from datetime import datetime
 import os
 import html
+import heapq
+from sent_history import SentHistory
+from link_canonical import canonical_link
+from circuit_breaker import CircuitBreakerRegistry, CLOSED, OPEN
+from keyword_index import InvertedIndex, KeywordRule
+
+# requests, schedule, webbrowser, email.utils, article_enricher, key_setup은 시작 속도를 위해
+# 처음 사용할 때 불러옴
+
+# 조회수 높은 뉴스 키워드 (화제성, 중요도)
+HOT_KEYWORDS = [
+    '대통령', '총리', '국회', '정부', '정치',
+    '경제', '금융', '주식', '부동산', '기업',
+    '사건', '사고', '범죄', '교통', '교육',
+    '코로나', '감염', '백신', '의료', '건강',
+    '날씨', '태풍', '지진', '재해', '안전',
+    '스포츠', '축구', '야구', '올림픽', '월드컵',
+    '연예', '드라마', '영화', '음악', '가수',
+    'IT', '기술', '인공지능', '로봇', '스마트폰'
+]
+
+# 최신순 시간대별 검색 키워드 (시각 0~23 → 검색어)
+TIME_QUERY_TABLE = (
+    ["뉴스 정치 경제 사회"] * 6 +       # 00~05시
+    ["정치 경제 사회 아침뉴스"] * 6 +    # 06~11시
+    ["경제 사회 정치 오후뉴스"] * 6 +    # 12~17시
+    ["정치 사회 경제 저녁뉴스"] * 4 +    # 18~21시
+    ["뉴스 정치 경제 사회"] * 2          # 22~23시
+)
+
+# 최신성 감쇠 반감기 (초) - 6시간 지난 기사는 점수 절반
+RECENCY_HALF_LIFE = 6 * 3600
+
+# 전송 기록 블룸 필터 설정 (예상 저장 개수, 목표 오탐률, 보존 기간)
+SENT_HISTORY_CAPACITY = 100000
+SENT_HISTORY_FP_RATE = 0.01
+SENT_HISTORY_DAYS = 30
+
+# 전송된 뉴스를 제외하고도 충분하도록 요청 개수의 몇 배를 가져올지
+FETCH_MULTIPLIER = 20
+
+# 네이버 뉴스 API 페이지 크기(display 최대값)와 가져올 수 있는 최대 개수(start 최대 1000)
+NEWS_API_PAGE_SIZE = 100
+NEWS_API_MAX_RESULTS = 1000
+
+# 원문 보강 대상 개수 (순위 상위 기사만 원문을 가져옴)
+ENRICH_LIMIT = 30
+
+# 순위 선별 시 요청 개수에 더해 남겨둘 후보 수 (미리 가져온 뒤 전송된 기사 대비)
+RANK_MARGIN = 5
 
 class NewsAutomation:
     def __init__(self):
@@ -33,6 +79,29 @@ class NewsAutomation:
         y = (self.root.winfo_screenheight() // 2) - (500 // 2)
         self.root.geometry(f"600x500+{x}+{y}")
         
+        self.init_state()
+        
+        # config 폴더가 없으면 생성 (상위 디렉토리에)
+        os.makedirs("../config", exist_ok=True)
+        
+        self.setup_ui()
+        
+        # 전송 기록 (파일 저장 + 블룸 필터, 시작 시 파일에서 재구성)
+        self.sent_history = SentHistory("../config/sent_history.txt",
+                                        capacity=SENT_HISTORY_CAPACITY,
+                                        fp_rate=SENT_HISTORY_FP_RATE,
+                                        retention_days=SENT_HISTORY_DAYS,
+                                        key_func=canonical_link,
+                                        log=self.log_message)
+        
+        self.load_keys()
+        self.load_kakao_token()  # 카카오톡 토큰 로드
+        self.on_sort_change()  # 초기 상태 설정
+        self.on_mode_change()  # 초기 모드 설정
+        self.refresh_health_label()  # 연결 상태 주기적 갱신
+        
+    def init_state(self):
+        """화면(Tk)과 무관한 상태 초기화 (시뮬레이션에서도 같은 상태를 사용)"""
         # API 키
         self.naver_id = ""
         self.naver_secret = ""
@@ -46,18 +115,35 @@ class NewsAutomation:
         self.is_running = False
         self.scheduler_thread = None
         
-        # 캐시 (간단한 리스트)
-        self.sent_urls = []
+        # 미리 가져온 뉴스 (다음 전송 시각용)
+        self.prefetch_cache = None
+        self.prefetched_run_at = None
+        self.prefetch_lock = threading.Lock()
         
-        # config 폴더가 없으면 생성 (상위 디렉토리에)
-        os.makedirs("../config", exist_ok=True)
+        # 원문 보강 (처음 사용할 때 생성)
+        self.enricher = None
         
-        self.setup_ui()
-        self.load_keys()
-        self.load_kakao_token()  # 카카오톡 토큰 로드
-        self.on_sort_change()  # 초기 상태 설정
-        self.on_mode_change()  # 초기 모드 설정
+        # API 키 설정 창
+        self.key_setup_window = None
+        
+        # 모아서 전송 대기 중인 뉴스
+        self.digest_buffer = []
+        self.digest_keys = set()
+        self.digest_started_at = None
+        self.digest_lock = threading.Lock()
         
+        # 엔드포인트/검색어별 회로 차단기 (연속 실패 시 호출 중단)
+        self.breakers = CircuitBreakerRegistry(clock=lambda: self.now().timestamp(), log=self.log_message)
+        
+        # 뉴스 수집 설정 (시뮬레이션 결과에 따라 조정)
+        self.fetch_multiplier = FETCH_MULTIPLIER
+        self.record_file = None  # 지정하면 API 응답을 시뮬레이션용으로 기록
+        
+        # 전송 채널 (설정이 바뀌면 다시 생성)
+        self.webhook_url = ""
+        self.dispatcher = None
+        self.dispatcher_settings = None
+    
     def setup_ui(self):
         """GUI 설정"""
         # 스크롤 가능한 캔버스 생성
@@ -106,6 +192,14 @@ class NewsAutomation:
         self.auth_status_label = ttk.Label(auth_frame, text="인증 필요", foreground="red")
         self.auth_status_label.pack(side=tk.LEFT)
         
+        # 연결 상태 (회로 차단기)
+        health_frame = ttk.Frame(main_frame)
+        health_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        self.health_label = ttk.Label(health_frame, text="연결 상태: 정상", foreground="green", cursor="hand2")
+        self.health_label.pack(side=tk.LEFT)
+        self.health_label.bind("<Button-1>", self.log_breaker_stats)  # 누르면 호출/실패/차단 횟수 표시
+        
         # 뉴스 설정
         news_frame = ttk.LabelFrame(main_frame, text="뉴스 설정", padding="10")
         news_frame.pack(fill=tk.X, pady=(0, 10))
@@ -134,6 +228,27 @@ class NewsAutomation:
                                    font=("Arial", 8), foreground="gray")
         keyword_example.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
         
+        # 키워드 필터 (정렬 방식과 관계없이 적용)
+        filter_frame = ttk.Frame(news_frame)
+        filter_frame.grid(row=4, column=0, columnspan=4, sticky=tk.W, pady=(10, 0))
+        
+        ttk.Label(filter_frame, text="필터:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        self.filter_var = tk.StringVar(value="")
+        ttk.Entry(filter_frame, textvariable=self.filter_var, width=30).grid(row=0, column=1, sticky=tk.W, padx=(5, 0))
+        ttk.Label(filter_frame, text="예시: 경제, 주식, +코스피, -연예 (+: 반드시 포함, -: 제외)",
+                  font=("Arial", 8), foreground="gray").grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        
+        # 원문 보강 (원문 기사 페이지에서 요약/이미지 추출)
+        self.enrich_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(news_frame, text="원문 요약 보강 (느릴 수 있음)", variable=self.enrich_var).grid(row=2, column=0, columnspan=4, sticky=tk.W, pady=(10, 0))
+        
+        # 전송 채널 (카카오톡 형식, 파일 기록)
+        ttk.Label(news_frame, text="카카오 형식:").grid(row=3, column=0, sticky=tk.W, padx=(0, 5), pady=(10, 0))
+        self.kakao_format_var = tk.StringVar(value="텍스트")
+        ttk.Combobox(news_frame, textvariable=self.kakao_format_var, values=["텍스트", "리스트"], state="readonly", width=8).grid(row=3, column=1, pady=(10, 0))
+        self.stub_sink_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(news_frame, text="파일 기록", variable=self.stub_sink_var).grid(row=3, column=2, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
         # 스케줄 설정
         schedule_frame = ttk.LabelFrame(main_frame, text="스케줄 설정", padding="10")
         schedule_frame.pack(fill=tk.X, pady=(0, 10))
@@ -162,6 +277,17 @@ class NewsAutomation:
                                    font=("Arial", 8), foreground="gray")
         self.alarm_info.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
         
+        # 미리 가져오기 설정 (알람 모드에서 전송 N분 전에 뉴스를 미리 수집, 0이면 사용 안 함)
+        ttk.Label(schedule_frame, text="미리 가져오기(분 전, 알람 모드):").grid(row=4, column=0, sticky=tk.W, pady=(10, 0))
+        self.prefetch_var = tk.StringVar(value="2")
+        ttk.Spinbox(schedule_frame, from_=0, to=60, textvariable=self.prefetch_var, width=5).grid(row=4, column=1, sticky=tk.W, padx=(5, 0), pady=(10, 0))
+        
+        # 모아서 전송 (간격 모드에서 새 뉴스를 모아 개수가 차거나 최대 대기 시간이 지나면 한 번에 전송)
+        self.digest_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(schedule_frame, text="모아서 전송 - 최대 대기(분):", variable=self.digest_var).grid(row=5, column=0, sticky=tk.W, pady=(10, 0))
+        self.digest_latency_var = tk.StringVar(value="10")
+        ttk.Spinbox(schedule_frame, from_=1, to=1440, textvariable=self.digest_latency_var, width=5).grid(row=5, column=1, sticky=tk.W, padx=(5, 0), pady=(10, 0))
+        
         # 제어 버튼
         control_frame = ttk.Frame(main_frame)
         control_frame.pack(fill=tk.X, pady=(0, 10))
@@ -194,6 +320,8 @@ class NewsAutomation:
                             self.naver_secret = line.split('=', 1)[1].strip()
                         elif line.startswith('KAKAO_KEY='):
                             self.kakao_key = line.split('=', 1)[1].strip()
+                        elif line.startswith('WEBHOOK_URL='):
+                            self.webhook_url = line.split('=', 1)[1].strip()
                 
                 if self.naver_id and self.naver_secret and self.kakao_key:
                     self.key_status_label.config(text="API 키 설정됨", foreground="green")
@@ -264,14 +392,17 @@ class NewsAutomation:
             self.alarm_info.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
     
     def open_key_setup(self):
-        """API 키 설정 창 열기"""
-        import subprocess
-        import sys
-        import os
-        # 현재 파일의 디렉토리 (src/)를 절대 경로로 사용
-        src_dir = os.path.dirname(os.path.abspath(__file__))
-        subprocess.Popen([sys.executable, "key_setup.py"], cwd=src_dir)
-        self.load_keys()  # 키 다시 로드
+        """API 키 설정 창 열기 (같은 프로세스의 Toplevel 창, 저장 즉시 키 다시 로드)"""
+        if self.key_setup_window is not None and self.key_setup_window.root.winfo_exists():
+            self.key_setup_window.root.lift()
+            return
+        
+        from key_setup import KeySetupGUI
+        self.key_setup_window = KeySetupGUI(master=self.root, on_save=self.load_keys)
+    
+    def now(self):
+        """현재 시각 (시뮬레이션에서는 가상 시각으로 대체)"""
+        return datetime.now()
     
     def log_message(self, message):
         """로그 메시지 추가"""
@@ -288,6 +419,11 @@ class NewsAutomation:
             return
         
         try:
+            import urllib.parse
+            import webbrowser
+            import requests
+            from tkinter import simpledialog
+            
             self.log_message("카카오 인증 시작...")
             
             # 인증 URL 생성
@@ -305,7 +441,7 @@ class NewsAutomation:
             webbrowser.open(auth_url_with_params)
             
             # 인증 코드 입력 받기
-            code = tk.simpledialog.askstring("인증 코드", 
+            code = simpledialog.askstring("인증 코드", 
                 "브라우저에서 로그인 후 리다이렉트된 URL을 확인하세요.\n\n"
                 "URL 예시: http://localhost:8080/callback?code=ABC123...\n"
                 "이 URL에서 'code=' 뒤의 긴 문자열을 복사하여 아래에 붙여넣으세요:\n\n"
@@ -343,94 +479,321 @@ class NewsAutomation:
         except Exception as e:
             self.log_message(f"인증 오류: {str(e)}")
     
-    def get_news(self):
-        """네이버 뉴스 가져오기"""
-        try:
-            url = "https://openapi.naver.com/v1/search/news.json"
-            headers = {
-                "X-Naver-Client-Id": self.naver_id,
-                "X-Naver-Client-Secret": self.naver_secret
+    def build_query(self, hour=None):
+        """검색 키워드 생성 (hour: 시간대별 키워드를 고를 시각, 기본값은 현재 시각)"""
+        if self.sort_var.get() == "관련도":
+            # 사용자가 입력한 키워드 사용 (쉼표로 분리된 키워드 처리)
+            query = self.keyword_var.get().strip()
+            if not query:
+                query = "정치, 경제, 사회"  # 기본값
+            # 쉼표로 분리된 키워드를 공백으로 연결
+            return query.replace(",", " ").replace("  ", " ").strip()
+        
+        # 최신순: 시간대별 키워드 (미리 계산된 표에서 조회)
+        if hour is None:
+            hour = self.now().hour
+        return TIME_QUERY_TABLE[hour]
+    
+    def fetch_news_items(self, query, sort_option, fetch_count):
+        """네이버 뉴스 API를 페이지 단위(start)로 호출하여 fetch_count개까지 가져옴 (첫 페이지 오류 시 None)"""
+        url = "https://openapi.naver.com/v1/search/news.json"
+        headers = {
+            "X-Naver-Client-Id": self.naver_id,
+            "X-Naver-Client-Secret": self.naver_secret
+        }
+        
+        items = []
+        for start in range(1, fetch_count + 1, NEWS_API_PAGE_SIZE):
+            params = {
+                "query": query,
+                "display": min(NEWS_API_PAGE_SIZE, fetch_count - start + 1),
+                "start": start,
+                "sort": sort_option
             }
             
-            # 검색 키워드 설정
-            if self.sort_var.get() == "관련도":
-                # 사용자가 입력한 키워드 사용 (쉼표로 분리된 키워드 처리)
-                query = self.keyword_var.get().strip()
-                if not query:
-                    query = "정치, 경제, 사회"  # 기본값
-                # 쉼표로 분리된 키워드를 공백으로 연결
-                query = query.replace(",", " ").replace("  ", " ").strip()
-            else:
-                # 최신순: 시간대별 키워드
-                current_hour = datetime.now().hour
-                if 6 <= current_hour < 12:
-                    query = "정치 경제 사회 아침뉴스"
-                elif 12 <= current_hour < 18:
-                    query = "경제 사회 정치 오후뉴스"
-                elif 18 <= current_hour < 22:
-                    query = "정치 사회 경제 저녁뉴스"
-                else:
-                    query = "뉴스 정치 경제 사회"
+            # 다음 페이지를 못 가져와도 이미 가져온 뉴스로 진행 (첫 페이지부터 실패하면 None)
+            response = self.call_news_api_guarded(url, headers, params)
+            if response is None:
+                return items if items else None
             
+            if response.status_code != 200:
+                self.log_message(f"뉴스 API 오류: {response.status_code}")
+                if response.status_code == 401:
+                    self.log_message("API 키가 올바르지 않습니다.")
+                elif response.status_code == 403:
+                    self.log_message("API 사용량이 초과되었습니다.")
+                return items if items else None
+            
+            page = response.json().get("items", [])
+            items.extend(page)
+            if len(page) < params["display"]:
+                break  # 마지막 페이지
+        return items
+    
+    def fetch_news(self, query):
+        """네이버 뉴스 API 호출 후 중복 제거 및 순위 계산된 후보 목록 반환 (오류 시 None)"""
+        try:
             # 정렬 옵션 설정
             sort_option = "date" if self.sort_var.get() == "최신" else "sim"
             
-            # 충분한 개수를 가져오기 위해 더 많이 요청
+            # 전송된 뉴스가 많을 수 있으므로 요청 개수의 N배(기본 20배)를 가져옴 (100개 넘으면 여러 페이지)
             requested_count = int(self.count_var.get())
-            # 전송된 뉴스가 많을 수 있으므로 더 많이 가져오기
-            fetch_count = max(requested_count * 20, 100)  # 최소 100개, 요청 개수의 20배
+            fetch_count = min(requested_count * self.fetch_multiplier, NEWS_API_MAX_RESULTS)
             
-            params = {
-                "query": query,
-                "display": min(fetch_count, 100),  # API 최대 100개 제한
-                "sort": sort_option
-            }
+            items = self.fetch_news_items(query, sort_option, fetch_count)
+            if items is None:
+                return None
             
-            response = requests.get(url, headers=headers, params=params)
+            news_list = []
             
-            if response.status_code == 200:
-                data = response.json()
-                news_list = []
+            for item in items:
+                # HTML 태그 제거 및 엔티티 처리
+                title = item.get("title", "").replace("<b>", "").replace("</b>", "")
+                title = self.clean_html_entities(title)
                 
-                for item in data.get("items", []):
-                    # HTML 태그 제거 및 엔티티 처리
-                    title = item.get("title", "").replace("<b>", "").replace("</b>", "")
-                    title = self.clean_html_entities(title)
-                    
-                    description = item.get("description", "").replace("<b>", "").replace("</b>", "")
-                    description = self.clean_html_entities(description)
-                    
-                    link = item.get("link", "")
-                    pub_date = item.get("pubDate", "")
-                    
-                    news_list.append({
-                        "title": title,
-                        "description": description,
-                        "link": link,
-                        "pub_date": pub_date
-                    })
-                
-                # 중복 제거 (같은 뉴스)
-                news_list = self.remove_duplicates(news_list)
+                description = item.get("description", "").replace("<b>", "").replace("</b>", "")
+                description = self.clean_html_entities(description)
                 
-                # 전송된 뉴스 제거 (이전에 보낸 뉴스)
-                requested_count = int(self.count_var.get())
-                news_list = self.remove_sent_news(news_list, requested_count)
+                link = item.get("link", "")
+                originallink = item.get("originallink", "")
+                pub_date = item.get("pubDate", "")
                 
-                # 요청한 개수만큼만 반환
-                return news_list[:requested_count]
-            else:
-                self.log_message(f"뉴스 API 오류: {response.status_code}")
-                if response.status_code == 401:
-                    self.log_message("API 키가 올바르지 않습니다.")
-                elif response.status_code == 403:
-                    self.log_message("API 사용량이 초과되었습니다.")
+                news_list.append({
+                    "title": title,
+                    "description": description,
+                    "link": link,
+                    "originallink": originallink,
+                    "key": canonical_link(link),  # 중복/전송 확인용 정규화 키
+                    "pub_date": pub_date,
+                    "pub_ts": self.parse_pub_date(pub_date)  # 한 번만 파싱하여 epoch 정수로 보관
+                })
+            
+            # 중복 제거 (같은 뉴스)
+            news_list = self.remove_duplicates(news_list)
+            
+            # 포함/제외 키워드 필터
+            news_list = self.apply_keyword_filter(news_list)
+            
+            # 전송된 뉴스를 먼저 제거하여 순위 계산 대상을 줄임
+            news_list = self.remove_sent_news(news_list)
+            
+            # 상위 기사만 선별 (전송 직전 재확인에서 빠질 수 있어 여유분 포함)
+            keep_count = requested_count + RANK_MARGIN
+            if sort_option == "sim":
+                # 관련도순: 네이버 검색 순위를 그대로 사용하고 앞에서부터 자름
+                news_list = news_list[:keep_count]
+                if self.enrich_var.get():
+                    self.get_enricher().enrich(news_list)
+                return news_list
+            
+            # 최신순: 키워드 가중치 + 최신성 감쇠로 순위 계산
+            if self.enrich_var.get():
+                # 원문 보강: 상위 후보만 원문 요약으로 보강 후 다시 선별
+                head = self.rank_news(news_list, max(keep_count, ENRICH_LIMIT))
+                return self.rank_news(self.get_enricher().enrich(head), keep_count)
+            return self.rank_news(news_list, keep_count)
+            
+        except Exception as e:
+            self.log_message(f"뉴스 가져오기 오류: {str(e)}")
+            return None
+    
+    def call_news_api_guarded(self, url, headers, params):
+        """회로 차단기를 거쳐 네이버 뉴스 API 호출 (차단 중이면 None)"""
+        query_breaker = self.breakers.get(f"검색어 '{params['query']}'")
+        endpoint_breaker = self.breakers.get("네이버 API")
+        
+        if not query_breaker.allow():
+            self.log_message(f"검색어 일시 차단 중 ({query_breaker.retry_in()}초 후 재시도)")
+            return None
+        if not endpoint_breaker.allow():
+            query_breaker.cancel()
+            self.log_message(f"네이버 API 일시 차단 중 ({endpoint_breaker.retry_in()}초 후 재시도)")
+            return None
+        
+        try:
+            response = self.call_news_api(url, headers, params)
+        except Exception as e:
+            # 네트워크 오류: 엔드포인트 문제로 간주
+            endpoint_breaker.record_failure(str(e))
+            query_breaker.cancel()
+            self.update_health_label()
+            raise
+        
+        status = response.status_code
+        if status == 200:
+            endpoint_breaker.record_success()
+            query_breaker.record_success()
+        elif status in (401, 403, 429) or status >= 500:
+            # 키 오류, 사용량 초과, 서버 장애: 모든 검색어에 영향
+            endpoint_breaker.record_failure(f"HTTP {status}")
+            query_breaker.cancel()
+        else:
+            # 그 밖의 오류(잘못된 검색어 등): 해당 검색어만 차단
+            endpoint_breaker.record_success()
+            query_breaker.record_failure(f"HTTP {status}")
+        self.update_health_label()
+        return response
+    
+    def update_health_label(self):
+        """회로 차단기 상태를 화면에 표시 (정상이 아닌 것만)"""
+        for breaker in self.breakers.all():
+            breaker.refresh()
+        unhealthy = [breaker for breaker in self.breakers.all() if breaker.state != CLOSED]
+        if not unhealthy:
+            self.health_label.config(text="연결 상태: 정상", foreground="green")
+            return
+        
+        color = "red" if any(breaker.state == OPEN for breaker in unhealthy) else "orange"
+        text = ", ".join(breaker.status_text() for breaker in unhealthy)
+        self.health_label.config(text=f"연결 상태: {text}", foreground=color)
+    
+    def log_breaker_stats(self, event=None):
+        """회로 차단기별 호출/실패/차단 횟수를 로그에 표시"""
+        breakers = self.breakers.all()
+        if not breakers:
+            self.log_message("연결 통계: 아직 호출 없음")
+            return
+        
+        for breaker in breakers:
+            stats = breaker.snapshot()
+            text = f"연결 통계 - {stats['name']}: 호출 {stats['calls']}회, 실패 {stats['failures']}회, 차단 {stats['rejected']}회"
+            if stats['last_error']:
+                text += f" (최근 오류: {stats['last_error']})"
+            self.log_message(text)
+    
+    def refresh_health_label(self):
+        """차단 중에는 호출이 없어 상태가 바뀌지 않으므로 1초마다 남은 시간/확인 중 상태 갱신"""
+        try:
+            self.update_health_label()
+        except Exception as e:
+            self.log_message(f"연결 상태 갱신 오류: {str(e)}")
+        self.root.after(1000, self.refresh_health_label)
+    
+    def call_news_api(self, url, headers, params):
+        """네이버 뉴스 API 요청 (기록 파일이 지정되면 응답을 시뮬레이션용으로 저장)"""
+        import requests
+        
+        response = requests.get(url, headers=headers, params=params)
+        if self.record_file:
+            try:
+                entry = {
+                    "t": int(self.now().timestamp()),
+                    "query": params["query"],
+                    "start": params["start"],
+                    "sort": params["sort"],
+                    "status": response.status_code,
+                    "items": response.json().get("items", []) if response.status_code == 200 else []
+                }
+                with open(self.record_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            except Exception as e:
+                self.log_message(f"응답 기록 오류: {str(e)}")
+        return response
+    
+    def get_enricher(self):
+        """원문 보강기 반환 (처음 호출 시 생성)"""
+        if self.enricher is None:
+            from article_enricher import ArticleEnricher
+            self.enricher = ArticleEnricher("../config/content_cache.json", log=self.log_message)
+        return self.enricher
+    
+    def get_news(self, use_prefetch=True):
+        """네이버 뉴스 가져오기 (미리 가져온 결과가 있으면 캐시 사용, 수동 전송은 캐시를 남겨둠)"""
+        try:
+            query = self.build_query()
+            requested_count = int(self.count_var.get())
+            
+            news_list = self.take_prefetched(query) if use_prefetch else None
+            if news_list is not None:
+                # 미리 가져온 뒤 전송된 뉴스가 있을 수 있으므로 선별된 후보만 다시 확인
+                return self.remove_sent_news(news_list, requested_count)
+            
+            news_list = self.fetch_news(query)
+            if news_list is None:
                 return []
-                
+            # 전송된 뉴스는 이미 제거되고 순위가 매겨져 있으므로 앞에서부터 자름
+            return news_list[:requested_count]
+            
         except Exception as e:
             self.log_message(f"뉴스 가져오기 오류: {str(e)}")
             return []
     
+    def prefetch_news(self, run_at):
+        """다음 전송 시각(run_at)에 사용할 뉴스를 미리 가져와 캐시에 저장"""
+        query = self.build_query(run_at.hour)
+        news_list = self.fetch_news(query)
+        if news_list is None:
+            return
+        
+        with self.prefetch_lock:
+            self.prefetch_cache = {
+                "query": query,
+                "run_at": run_at,
+                "fetched_at": self.now().timestamp(),
+                "news": news_list
+            }
+        self.log_message(f"{run_at.strftime('%H:%M')} 전송용 뉴스 미리 가져옴: {len(news_list)}개")
+    
+    def take_prefetched(self, query):
+        """미리 가져온 뉴스 꺼내기 (검색어가 다르거나 오래된 경우 None)"""
+        with self.prefetch_lock:
+            cache = self.prefetch_cache
+            self.prefetch_cache = None
+        
+        if not cache or cache["query"] != query:
+            return None
+        
+        # 리드 타임보다 1분 이상 오래된 결과는 사용하지 않음
+        max_age = (self.get_prefetch_lead() + 1) * 60
+        if self.now().timestamp() - cache["fetched_at"] > max_age:
+            return None
+        return cache["news"]
+    
+    def get_prefetch_lead(self):
+        """미리 가져오기 리드 타임(분), 잘못된 값이면 0 (사용 안 함)"""
+        try:
+            return max(int(self.prefetch_var.get()), 0)
+        except (ValueError, tk.TclError):
+            return 0
+    
+    def maybe_prefetch(self):
+        """다음 뉴스 전송이 리드 타임 안으로 다가오면 미리 가져오기 실행 (알람 모드에서만)"""
+        # 간격 모드는 리드 타임만큼 오래된 뉴스를 보내게 되어 지연만 늘어나므로 사용하지 않음
+        if self.mode_var.get() != "alarm":
+            return
+        
+        lead = self.get_prefetch_lead()
+        if not lead:
+            return
+        
+        import schedule
+        
+        jobs = schedule.get_jobs("news")
+        if not jobs:
+            return
+        next_run = min(job.next_run for job in jobs)
+        
+        # 같은 전송 시각에 대해서는 한 번만 가져옴
+        if next_run == self.prefetched_run_at:
+            return
+        if (next_run - self.now()).total_seconds() <= lead * 60:
+            self.prefetched_run_at = next_run
+            self.prefetch_news(next_run)
+    
+    def apply_keyword_filter(self, news_list):
+        """필터 규칙(예: 경제, +주식, -연예)에 맞는 뉴스만 남김"""
+        try:
+            rule = KeywordRule.parse(self.filter_var.get())
+            if rule.is_empty() or not news_list:
+                return news_list
+            
+            matched = InvertedIndex(news_list).evaluate(rule)
+            return [news for i, news in enumerate(news_list) if i in matched]
+            
+        except Exception as e:
+            self.log_message(f"키워드 필터 오류: {str(e)}")
+            return news_list
+    
     def remove_duplicates(self, news_list):
         """중복 뉴스 제거"""
         try:
@@ -440,13 +803,13 @@ class NewsAutomation:
             
             for news in news_list:
                 title = news['title'].strip()
-                link = news['link'].strip()
+                key = news['key']
                 
-                # 제목과 링크로 중복 체크
+                # 제목과 정규화된 링크로 중복 체크
                 title_lower = title.lower()
-                if title_lower not in seen_titles and link not in seen_links:
+                if title_lower not in seen_titles and key not in seen_links:
                     seen_titles.add(title_lower)
-                    seen_links.add(link)
+                    seen_links.add(key)
                     unique_news.append(news)
             
             # self.log_message(f"중복 제거: {len(news_list)}개 → {len(unique_news)}개")  # 사용자에게 숨김
@@ -456,18 +819,18 @@ class NewsAutomation:
             self.log_message(f"중복 제거 오류: {str(e)}")
             return news_list
     
-    def remove_sent_news(self, news_list, requested_count):
-        """이전에 전송된 뉴스 제거"""
+    def remove_sent_news(self, news_list, requested_count=None):
+        """이전에 전송된 뉴스 제거 (requested_count를 지정하지 않으면 전부 반환)"""
         try:
             new_news = []
             removed_count = 0
             
+            # 블룸 필터로 걸러내고, 전송됐을 수도 있는 링크만 파일에서 확인
+            unsent_keys = self.sent_history.filter_unsent(news['key'] for news in news_list)
+            
             for news in news_list:
-                link = news['link'].strip()
-                title = news['title'].strip()
-                
-                # 전송된 뉴스인지 확인
-                if link not in self.sent_urls:
+                # 전송된 뉴스인지 확인 (정규화된 키 기준, 모아서 전송 대기 중인 뉴스도 제외)
+                if news['key'] in unsent_keys and news['key'] not in self.digest_keys:
                     new_news.append(news)
                 else:
                     removed_count += 1
@@ -483,137 +846,202 @@ class NewsAutomation:
             self.log_message(f"전송된 뉴스 제거 오류: {str(e)}")
             return news_list
     
-    def filter_high_view_news(self, news_list):
-        """조회수 높은 뉴스 선별"""
+    def parse_pub_date(self, pub_date):
+        """RFC-822 형식의 pubDate를 epoch 초(정수)로 변환 (실패 시 0)"""
+        if not pub_date:
+            return 0
+        from email.utils import parsedate_to_datetime
         try:
-            # 조회수 높은 뉴스 특징을 기반으로 선별
-            scored_news = []
-            
-            for news in news_list:
-                score = 0
-                title = news['title'].lower()
-                description = news['description'].lower()
-                
-                # 조회수 높은 뉴스 키워드 (화제성, 중요도)
-                hot_keywords = [
-                    '대통령', '총리', '국회', '정부', '정치',
-                    '경제', '금융', '주식', '부동산', '기업',
-                    '사건', '사고', '범죄', '교통', '교육',
-                    '코로나', '감염', '백신', '의료', '건강',
-                    '날씨', '태풍', '지진', '재해', '안전',
-                    '스포츠', '축구', '야구', '올림픽', '월드컵',
-                    '연예', '드라마', '영화', '음악', '가수',
-                    'IT', '기술', '인공지능', '로봇', '스마트폰'
-                ]
-                
-                # 키워드 매칭 점수
-                for keyword in hot_keywords:
-                    if keyword in title:
-                        score += 3
-                    if keyword in description:
-                        score += 1
-                
-                # 제목 길이 (적당한 길이가 조회수 높음)
-                title_len = len(news['title'])
-                if 20 <= title_len <= 60:
-                    score += 2
-                elif 10 <= title_len <= 80:
-                    score += 1
-                
-                # 설명 길이 (충분한 설명이 있는 뉴스)
-                desc_len = len(news['description'])
-                if desc_len > 50:
-                    score += 1
-                
-                # 발행 시간 (최근 뉴스 우선)
-                if news['pub_date']:
-                    score += 1
-                
-                scored_news.append((news, score))
-            
-            # 점수 순으로 정렬
-            scored_news.sort(key=lambda x: x[1], reverse=True)
-            
-            # 상위 뉴스만 반환
-            return [news for news, score in scored_news]
-            
+            return int(parsedate_to_datetime(pub_date).timestamp())
+        except (TypeError, ValueError, OverflowError):
+            return 0
+    
+    def keyword_weights(self, news_list):
+        """화제 키워드 매칭 점수 (기사 번호 → 점수), 묶음 전체에 대한 색인으로 계산"""
+        index = InvertedIndex(news_list)
+        weights = [0] * len(news_list)
+        for keyword in HOT_KEYWORDS:
+            for doc_id in index.lookup(keyword, "title"):
+                weights[doc_id] += 3
+            for doc_id in index.lookup(keyword, "description"):
+                weights[doc_id] += 1
+        return weights
+    
+    def score_news(self, news, now, keyword_weight=0):
+        """키워드 가중치에 최신성 지수 감쇠를 곱한 점수 계산"""
+        weight = 1 + keyword_weight  # 키워드가 없어도 최신성만으로 순위가 매겨지도록 기본값 1
+        
+        # 제목 길이 (적당한 길이가 조회수 높음)
+        title_len = len(news['title'])
+        if 20 <= title_len <= 60:
+            weight += 2
+        elif 10 <= title_len <= 80:
+            weight += 1
+        
+        # 설명 길이 (충분한 설명이 있는 뉴스)
+        if len(news['description']) > 50:
+            weight += 1
+        
+        # 발행 시간 (최근 뉴스 우선) - 발행 시각을 모르면 가장 오래된 것으로 취급
+        pub_ts = news.get('pub_ts', 0)
+        if not pub_ts:
+            return 0.0
+        age = max(now - pub_ts, 0)
+        return weight * 0.5 ** (age / RECENCY_HALF_LIFE)
+    
+    def rank_news(self, news_list, top_n):
+        """점수 상위 top_n개 뉴스 선별 (힙 사용, O(n log k))"""
+        try:
+            now = int(self.now().timestamp())
+            weights = self.keyword_weights(news_list)
+            # nlargest는 동점일 때 원래 순서를 유지하므로 API 정렬 순서가 보존됨
+            ranked = heapq.nlargest(top_n, range(len(news_list)),
+                                    key=lambda i: self.score_news(news_list[i], now, weights[i]))
+            return [news_list[i] for i in ranked]
         except Exception as e:
-            self.log_message(f"조회수 뉴스 선별 오류: {str(e)}")
-            return news_list
+            self.log_message(f"뉴스 순위 계산 오류: {str(e)}")
+            return news_list[:top_n]
     
-    def send_to_kakao(self, message):
-        """카카오톡으로 메시지 전송"""
-        if not self.access_token:
-            return False
+    def filter_high_view_news(self, news_list):
+        """조회수 높은 뉴스 선별"""
+        return self.rank_news(news_list, len(news_list))
+    
+    def get_dispatcher(self):
+        """현재 설정에 맞는 전송 채널 구성 (설정이 바뀌면 다시 생성)"""
+        from notification_sinks import (KakaoMemoSink, KakaoListSink, WebhookSink,
+                                        StubSink, SinkDispatcher)
         
+        settings = (self.kakao_format_var.get(), self.webhook_url, self.stub_sink_var.get())
+        if self.dispatcher is not None and self.dispatcher_settings == settings:
+            return self.dispatcher
+        
+        kakao_format, webhook_url, use_stub = settings
+        kakao_sink = KakaoListSink if kakao_format == "리스트" else KakaoMemoSink
+        # 카카오 API 호출 제한을 고려해 한 번에 하나씩, 최소 1초 간격으로 전송
+        # 카카오톡은 필수 채널: 카카오톡 전송이 실패하면 다른 채널이 성공해도 전송 기록에 남기지 않음
+        sinks = [kakao_sink(lambda: self.access_token, max_concurrency=1, min_interval=1.0,
+                            breaker=self.breakers.get("카카오톡"), required=True, log=self.log_message)]
+        if webhook_url:
+            sinks.append(WebhookSink(webhook_url, max_concurrency=4,
+                                     breaker=self.breakers.get("웹훅"), log=self.log_message))
+        if use_stub:
+            sinks.append(StubSink("../config/sent_messages.log", log=self.log_message))
+        
+        if self.dispatcher is not None:
+            self.dispatcher.shutdown()
+        self.dispatcher = SinkDispatcher(sinks, log=self.log_message)
+        self.dispatcher_settings = settings
+        return self.dispatcher
+    
+    def build_message(self, news_list):
+        """뉴스 목록으로 전송 메시지 구성"""
+        message = "📰 오늘의 최신 뉴스\n\n"
+        for i, news in enumerate(news_list[:5], 1):
+            message += f"{i}. {news['title']}\n"
+            if news['link']:
+                message += f"   링크: {news['link']}\n"
+            message += "\n"
+        return message
+    
+    def dispatch_message(self, message, news_list=()):
+        """모든 전송 채널에 병렬 전송 (필수 채널인 카카오톡이 성공하면 True)"""
         try:
-            url = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
-            
-            data = {
-                'template_object': json.dumps({
-                    'object_type': 'text',
-                    'text': message,
-                    'link': {
-                        'web_url': 'https://news.naver.com',
-                        'mobile_web_url': 'https://news.naver.com'
-                    }
-                })
-            }
-            
-            response = requests.post(url, headers=headers, data=data)
-            return response.status_code == 200
-            
+            dispatcher = self.get_dispatcher()
+            results = dispatcher.dispatch(message, news_list)
+            for name, ok in results.items():
+                if not ok:
+                    self.log_message(f"{name} 전송 실패")
+            self.update_health_label()
+            return dispatcher.succeeded(results)
         except Exception as e:
-            self.log_message(f"카카오 전송 오류: {str(e)}")
+            self.log_message(f"전송 오류: {str(e)}")
             return False
     
+    def deliver_news(self, news_list, record=True):
+        """메시지 하나에 담을 수 있는 개수씩 나눠 전송하고 전송된 개수 반환 (성공한 묶음만 전송 기록에 추가)"""
+        chunk_size = self.get_dispatcher().max_items
+        sent_count = 0
+        for i in range(0, len(news_list), chunk_size):
+            chunk = news_list[i:i + chunk_size]
+            if self.dispatch_message(self.build_message(chunk), chunk):
+                if record:
+                    self.sent_history.add_many(news['key'] for news in chunk)
+                sent_count += len(chunk)
+        return sent_count
+    
     def send_news_job(self):
         """뉴스 전송 작업"""
         try:
             self.log_message("뉴스 전송 작업 시작...")
             
-            # 뉴스 가져오기
-            news_list = self.get_news()
-            
-            if not news_list:
-                self.log_message("가져올 뉴스가 없습니다.")
-                return
-            
-            # 중복 제거
-            new_news = []
-            for news in news_list:
-                if news['link'] not in self.sent_urls:
-                    new_news.append(news)
+            # 뉴스 가져오기 (전송된 뉴스와 모아서 전송 대기 중인 뉴스는 이미 제외됨)
+            new_news = self.get_news()
             
             if not new_news:
                 self.log_message("새로운 뉴스가 없습니다.")
                 return
             
-            # 메시지 구성
-            message = "📰 오늘의 최신 뉴스\n\n"
-            for i, news in enumerate(new_news[:5], 1):
-                message += f"{i}. {news['title']}\n"
-                if news['link']:
-                    message += f"   링크: {news['link']}\n"
-                message += "\n"
-            
-            # 카카오톡으로 전송
-            if self.send_to_kakao(message):
-                # 전송된 URL 캐시에 추가
-                for news in new_news:
-                    self.sent_urls.append(news['link'])
-                
-                self.log_message(f"뉴스 전송 완료: {len(new_news)}개")
-            else:
-                self.log_message("뉴스 전송 실패")
+            # 모아서 전송: 바로 보내지 않고 대기 목록에 추가
+            if self.is_digest_mode():
+                self.add_to_digest(new_news)
+                self.flush_digest()
+                return
+            
+            # 전송 채널(카카오톡 등)로 전송 (실패한 뉴스는 기록하지 않아 다음에 다시 가져옴)
+            sent_count = self.deliver_news(new_news)
+            if sent_count:
+                self.log_message(f"뉴스 전송 완료: {sent_count}개")
+            if sent_count < len(new_news):
+                self.log_message(f"뉴스 전송 실패: {len(new_news) - sent_count}개")
                 
         except Exception as e:
             self.log_message(f"뉴스 전송 작업 오류: {str(e)}")
     
+    def is_digest_mode(self):
+        """모아서 전송 사용 여부 (간격 모드에서만)"""
+        return self.mode_var.get() == "interval" and self.digest_var.get()
+    
+    def get_digest_latency(self):
+        """모아서 전송 최대 대기 시간(초)"""
+        try:
+            return max(int(self.digest_latency_var.get()), 1) * 60
+        except (ValueError, tk.TclError):
+            return 600
+    
+    def add_to_digest(self, news_list):
+        """새 뉴스를 모아서 전송 대기 목록에 추가"""
+        with self.digest_lock:
+            if not self.digest_buffer:
+                self.digest_started_at = self.now()
+            for news in news_list:
+                if news['key'] not in self.digest_keys:
+                    self.digest_buffer.append(news)
+                    self.digest_keys.add(news['key'])
+            self.log_message(f"전송 대기: {len(self.digest_buffer)}개")
+    
+    def flush_digest(self, force=False):
+        """대기 뉴스가 전송 개수만큼 모였거나 최대 대기 시간이 지났으면 전송"""
+        with self.digest_lock:
+            if not self.digest_buffer:
+                return
+            
+            waited = (self.now() - self.digest_started_at).total_seconds()
+            if not (force or len(self.digest_buffer) >= int(self.count_var.get())
+                    or waited >= self.get_digest_latency()):
+                return
+            
+            batch = self.digest_buffer
+            self.digest_buffer = []
+            self.digest_keys = set()
+            self.digest_started_at = None
+        
+        # 메시지당 담을 수 있는 개수씩 전송 (실패한 뉴스는 기록하지 않아 다음에 다시 가져옴)
+        sent_count = self.deliver_news(batch)
+        if sent_count:
+            self.log_message(f"뉴스 전송 완료: {sent_count}개 (모아서 전송)")
+        if sent_count < len(batch):
+            self.log_message(f"뉴스 전송 실패: {len(batch) - sent_count}개")
+    
     def start_scheduler(self):
         """스케줄러 시작"""
         if not self.access_token:
@@ -625,39 +1053,7 @@ class NewsAutomation:
             self.start_button.config(state="disabled")
             self.stop_button.config(state="normal")
             
-            schedule.clear()
-            
-            if self.mode_var.get() == "interval":
-                # 간격 모드 (분 단위)
-                interval = int(self.interval_var.get())
-                schedule.every(interval).minutes.do(self.send_news_job)
-                self.log_message(f"간격 모드 시작: {interval}분마다")
-                
-                # 즉시 첫 뉴스 전송
-                self.log_message("첫 뉴스 전송 중...")
-                self.send_news_job()
-                
-            else:
-                # 알람 모드
-                times = [t.strip() for t in self.alarm_var.get().split(",")]
-                for time_str in times:
-                    hour, minute = map(int, time_str.split(":"))
-                    schedule.every().day.at(f"{hour:02d}:{minute:02d}").do(self.send_news_job)
-                self.log_message(f"알람 모드 시작: {', '.join(times)}")
-                
-                # 알람모드 자동 중지 스케줄 추가 (마지막 시간 + 1분 후)
-                if times:
-                    last_time = max(times, key=lambda x: (int(x.split(':')[0]), int(x.split(':')[1])))
-                    last_hour, last_minute = map(int, last_time.split(":"))
-                    # 마지막 시간 + 1분 후에 자동 중지
-                    if last_minute == 59:
-                        auto_stop_hour = (last_hour + 1) % 24
-                        auto_stop_minute = 0
-                    else:
-                        auto_stop_hour = last_hour
-                        auto_stop_minute = last_minute + 1
-                    
-                    schedule.every().day.at(f"{auto_stop_hour:02d}:{auto_stop_minute:02d}").do(self.auto_stop_alarm)
+            self.schedule_jobs()
             
             # 스케줄러 스레드 시작
             self.scheduler_thread = threading.Thread(target=self.run_scheduler, daemon=True)
@@ -668,13 +1064,61 @@ class NewsAutomation:
         except Exception as e:
             self.log_message(f"스케줄러 시작 오류: {str(e)}")
     
+    def schedule_jobs(self):
+        """현재 설정으로 뉴스 전송 작업 등록 (간격 모드는 첫 뉴스 즉시 전송)"""
+        import schedule
+        
+        schedule.clear()
+        self.prefetch_cache = None
+        self.prefetched_run_at = None
+        
+        if self.mode_var.get() == "interval":
+            # 간격 모드 (분 단위)
+            interval = int(self.interval_var.get())
+            schedule.every(interval).minutes.do(self.send_news_job).tag("news")
+            self.log_message(f"간격 모드 시작: {interval}분마다")
+            
+            # 즉시 첫 뉴스 전송
+            self.log_message("첫 뉴스 전송 중...")
+            self.send_news_job()
+            
+        else:
+            # 알람 모드
+            times = [t.strip() for t in self.alarm_var.get().split(",")]
+            for time_str in times:
+                hour, minute = map(int, time_str.split(":"))
+                schedule.every().day.at(f"{hour:02d}:{minute:02d}").do(self.send_news_job).tag("news")
+            self.log_message(f"알람 모드 시작: {', '.join(times)}")
+            
+            # 알람모드 자동 중지 스케줄 추가 (마지막 시간 + 1분 후)
+            if times:
+                last_time = max(times, key=lambda x: (int(x.split(':')[0]), int(x.split(':')[1])))
+                last_hour, last_minute = map(int, last_time.split(":"))
+                # 마지막 시간 + 1분 후에 자동 중지
+                if last_minute == 59:
+                    auto_stop_hour = (last_hour + 1) % 24
+                    auto_stop_minute = 0
+                else:
+                    auto_stop_hour = last_hour
+                    auto_stop_minute = last_minute + 1
+                
+                schedule.every().day.at(f"{auto_stop_hour:02d}:{auto_stop_minute:02d}").do(self.auto_stop_alarm)
+    
     def stop_scheduler(self):
         """스케줄러 중지"""
+        import schedule
+        
         self.is_running = False
         schedule.clear()
+        
+        # 대기 중인 뉴스는 중지 전에 전송 (전송이 오래 걸릴 수 있으므로 화면이 멈추지 않도록 별도 스레드에서)
+        if self.digest_buffer:
+            threading.Thread(target=self.flush_digest, kwargs={"force": True}, daemon=True).start()
+        
         self.start_button.config(state="normal")
         self.stop_button.config(state="disabled")
         self.log_message("스케줄러 중지됨")
+        self.log_breaker_stats()
     
     def auto_stop_alarm(self):
         """알람모드 자동 중지"""
@@ -685,9 +1129,20 @@ class NewsAutomation:
     def run_scheduler(self):
         """스케줄러 실행 루프"""
         while self.is_running:
-            schedule.run_pending()
+            self.scheduler_tick()
             time.sleep(1)
     
+    def scheduler_tick(self):
+        """스케줄러 1회 진행 (미리 가져오기 확인 후 예정된 작업 실행)"""
+        import schedule
+        
+        self.maybe_prefetch()
+        schedule.run_pending()
+        
+        # 새 뉴스가 없는 동안에도 최대 대기 시간이 지나면 전송 (모아서 전송을 끄면 남은 뉴스를 바로 전송)
+        if self.digest_buffer:
+            self.flush_digest(force=not self.is_digest_mode())
+    
     def test_send(self):
         """테스트 전송"""
         if not self.access_token:
@@ -696,7 +1151,7 @@ class NewsAutomation:
         
         try:
             message = "🧪 테스트 메시지입니다.\n\n네이버 뉴스 자동화 앱이 정상 작동합니다."
-            if self.send_to_kakao(message):
+            if self.dispatch_message(message):
                 self.log_message("테스트 전송 성공")
                 messagebox.showinfo("성공", "테스트 메시지가 전송되었습니다.")
             else:
@@ -718,8 +1173,8 @@ class NewsAutomation:
         try:
             self.log_message("🔥 뉴스 수집 및 전송 테스트 시작...")
             
-            # 뉴스 가져오기
-            news_list = self.get_news()
+            # 뉴스 가져오기 (다음 예약 전송용으로 미리 가져온 뉴스는 사용하지 않음)
+            news_list = self.get_news(use_prefetch=False)
             
             if not news_list:
                 self.log_message("❌ 뉴스를 가져올 수 없습니다.")
@@ -728,17 +1183,9 @@ class NewsAutomation:
             
             self.log_message(f"✅ {len(news_list)}개의 뉴스를 가져왔습니다.")
             
-            # 메시지 구성
-            message = "📰 오늘의 최신 뉴스\n\n"
-            for i, news in enumerate(news_list[:5], 1):
-                message += f"{i}. {news['title']}\n"
-                if news['link']:
-                    message += f"   링크: {news['link']}\n"
-                message += "\n"
-            
-            # 카카오톡으로 전송
+            # 전송 채널(카카오톡 등)로 전송 (리스트 형식은 여러 메시지로 나눠 전송)
             self.log_message("📱 카카오톡으로 전송 중...")
-            if self.send_to_kakao(message):
+            if self.deliver_news(news_list, record=False) == len(news_list):
                 self.log_message("✅ 뉴스 전송 성공!")
                 messagebox.showinfo("성공", "뉴스가 카카오톡으로 전송되었습니다!\n폰에서 알림을 확인해주세요.")
             else:
@@ -754,5 +1201,12 @@ class NewsAutomation:
         self.root.mainloop()
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="네이버 뉴스 알림 어플리케이션")
+    parser.add_argument("--record", help="네이버 API 응답을 기록할 파일 (simulate.py 재생용)")
+    args = parser.parse_args()
+    
     app = NewsAutomation()
+    app.record_file = args.record
     app.run()
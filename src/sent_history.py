@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+전송 기록 저장소
+- 전송한 기사 링크를 파일에 누적 저장 (재시작 후에도 유지)
+- 메모리의 블룸 필터로 "확실히 보내지 않은 기사"를 파일 조회 없이 판별
+- 오래된 기록/중복 기록을 주기적으로 정리(압축)하고 블룸 필터 재구성
+"""
+
+import hashlib
+import math
+import os
+import threading
+import time
+
+
+class BloomFilter:
+    def __init__(self, capacity, fp_rate):
+        self.capacity = max(int(capacity), 1)
+        self.fp_rate = fp_rate
+
+        # 비트 수 m = -n·ln(p) / (ln2)², 해시 수 k = (m/n)·ln2
+        self.num_bits = max(int(-self.capacity * math.log(fp_rate) / (math.log(2) ** 2)), 8)
+        self.num_hashes = max(int(round(self.num_bits / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        # 128비트 해시를 둘로 나눠 이중 해싱으로 k개 위치 생성
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def memory_bytes(self):
+        return len(self.bits)
+
+    def estimated_fp_rate(self):
+        """현재 저장 개수 기준 예상 오탐률"""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+
+class SentHistory:
+    def __init__(self, history_file, capacity=100000, fp_rate=0.01, retention_days=30,
+                 compact_every=1000, key_func=None, log=print):
+        self.history_file = history_file
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.retention_days = retention_days
+        self.compact_every = compact_every
+        self.key_func = key_func  # 정리 시 예전 형식 기록을 현재 키 형식으로 변환
+        self.log = log
+
+        self.lock = threading.Lock()
+        self.bloom = BloomFilter(capacity, fp_rate)
+        self.appended_since_compact = 0
+
+        # 시작 시 파일에서 블룸 필터 재구성
+        self.compact()
+
+    def _read_entries(self):
+        """파일의 (시각, 링크) 목록 읽기"""
+        entries = []
+        if not os.path.exists(self.history_file):
+            return entries
+        with open(self.history_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                sent_at, sep, link = line.rstrip('\n').partition('\t')
+                if sep and link:
+                    try:
+                        entries.append((int(sent_at), link))
+                    except ValueError:
+                        continue
+        return entries
+
+    def compact(self):
+        """보존 기간이 지난 기록과 중복 기록을 제거하고 블룸 필터 재구성"""
+        try:
+            with self.lock:
+                cutoff = time.time() - self.retention_days * 86400
+                latest = {}
+                for sent_at, link in self._read_entries():
+                    if self.key_func:
+                        link = self.key_func(link)
+                    if sent_at >= cutoff:
+                        latest[link] = max(sent_at, latest.get(link, 0))
+
+                tmp_file = self.history_file + ".tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    for link, sent_at in latest.items():
+                        f.write(f"{sent_at}\t{link}\n")
+                os.replace(tmp_file, self.history_file)
+
+                # 기록이 용량을 넘으면 오탐률 유지를 위해 필터를 키움
+                self.bloom = BloomFilter(max(self.capacity, len(latest) * 2), self.fp_rate)
+                for link in latest:
+                    self.bloom.add(link)
+                self.appended_since_compact = 0
+
+            self.log(self.report())
+        except Exception as e:
+            self.log(f"전송 기록 정리 오류: {str(e)}")
+
+    def report(self):
+        """저장 개수, 메모리 사용량, 예상 오탐률 요약"""
+        return (f"전송 기록 {self.bloom.count}개, 필터 메모리 {self.bloom.memory_bytes() / 1024:.1f}KB, "
+                f"예상 오탐률 {self.bloom.estimated_fp_rate() * 100:.2f}%")
+
+    def filter_unsent(self, links):
+        """보내지 않은 링크 집합 반환 (블룸 필터 양성인 것만 파일에서 한 번에 확인)"""
+        unsent = set()
+        maybe_sent = set()
+        with self.lock:
+            for link in links:
+                if link in self.bloom:
+                    maybe_sent.add(link)
+                else:
+                    unsent.add(link)
+
+            if maybe_sent:
+                sent = {link for _, link in self._read_entries() if link in maybe_sent}
+                unsent.update(maybe_sent - sent)
+        return unsent
+
+    def add_many(self, links):
+        """전송한 링크 기록 (파일 끝에 추가)"""
+        now = int(time.time())
+        with self.lock:
+            with open(self.history_file, 'a', encoding='utf-8') as f:
+                for link in links:
+                    f.write(f"{now}\t{link}\n")
+                    self.bloom.add(link)
+                    self.appended_since_compact += 1
+            need_compact = self.appended_since_compact >= self.compact_every
+
+        if need_compact:
+            self.compact()
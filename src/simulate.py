@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+재생(시뮬레이션) 모드
+- run.py --record로 기록한 네이버 API 응답을 가상 시각으로 빠르게 재생
+- 실제 스케줄러(schedule)와 NewsAutomation의 수집/전송 로직을 그대로 사용
+- 전송 지연(pubDate → 전송), 같은 기사 재전송률, 기사당 API 호출 수, 작업당 CPU 시간 보고
+
+사용법:
+    python simulate.py timeline.jsonl --interval 1,5,10 --count 3,5
+"""
+
+import argparse
+import bisect
+import datetime as datetime_module
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime, timedelta
+
+import schedule
+
+from run import NewsAutomation, FETCH_MULTIPLIER
+from sent_history import SentHistory
+from link_canonical import canonical_link
+from notification_sinks import StubSink, SinkDispatcher
+
+# 제목 비교 시 무시할 말머리([속보], (종합) 등)와 기호
+TITLE_TAG_PATTERN = re.compile(r'\[[^\]]*\]|\([^)]*\)|【[^】]*】')
+TITLE_SYMBOL_PATTERN = re.compile(r'[\W_]+')
+
+
+class Var:
+    """tkinter 변수 대용 (GUI 없이 get/set만 제공)"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class VirtualClock:
+    def __init__(self, start):
+        self.current = start
+
+    def advance(self, seconds):
+        self.current += timedelta(seconds=seconds)
+
+
+def install_virtual_clock(clock):
+    """schedule 모듈이 가상 시각을 쓰도록 datetime 모듈을 교체 (원래 모듈 반환)"""
+
+    class VirtualDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock.current
+
+    shim = types.ModuleType("datetime")
+    shim.__dict__.update(datetime_module.__dict__)
+    shim.datetime = VirtualDatetime
+
+    original = schedule.datetime
+    schedule.datetime = shim
+    return original
+
+
+class Timeline:
+    """기록된 응답 (검색어/페이지별 시각 순 정렬)"""
+
+    def __init__(self, path):
+        # (검색어, 시작 위치) → 응답 목록 (start가 없는 예전 기록은 첫 페이지)
+        self.entries = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.entries.setdefault((entry["query"], entry.get("start", 1)), []).append(entry)
+        for entries in self.entries.values():
+            entries.sort(key=lambda entry: entry["t"])
+
+        # 검색어 기록이 없을 때 대신 사용할 전체 첫 페이지 응답 (시각 순)
+        self.all_entries = sorted((entry for (query, start), entries in self.entries.items() if start == 1
+                                   for entry in entries), key=lambda entry: entry["t"])
+        if not self.all_entries:
+            raise ValueError(f"재생할 응답이 없습니다: {path}")
+
+        # 응답 시각 목록 (조회마다 다시 만들지 않도록 미리 계산)
+        self.times = {key: [entry["t"] for entry in entries] for key, entries in self.entries.items()}
+        self.all_times = [entry["t"] for entry in self.all_entries]
+        self.start = self.all_entries[0]["t"]
+        self.end = self.all_entries[-1]["t"]
+
+        # 기록되지 않은 검색어 → 다른 검색어 응답으로 대신한 횟수 (측정값 왜곡 확인용)
+        self.fallbacks = {}
+        # 기록되지 않은 다음 페이지 요청 횟수 (빈 페이지로 처리)
+        self.missing_pages = {}
+
+    def lookup(self, query, t, start=1):
+        """시각 t 이전의 가장 최근 응답 (첫 페이지 기록이 없으면 전체 검색어 중에서 찾고, 다음 페이지 기록이 없으면 None)"""
+        candidates = self.entries.get((query, start))
+        times = self.times.get((query, start))
+        if not candidates and start > 1:
+            self.missing_pages[query] = self.missing_pages.get(query, 0) + 1
+            return None
+        if not candidates:
+            self.fallbacks[query] = self.fallbacks.get(query, 0) + 1
+            candidates, times = self.all_entries, self.all_times
+        index = bisect.bisect_right(times, t) - 1
+        return candidates[max(index, 0)]
+
+
+class ReplayResponse:
+    def __init__(self, status_code, items):
+        self.status_code = status_code
+        self.items = items
+
+    def json(self):
+        return {"items": self.items}
+
+
+class SimulatedNewsAutomation(NewsAutomation):
+    """GUI 없이 기록된 응답으로 동작하는 NewsAutomation"""
+
+    def __init__(self, timeline, clock, history_file, mode="interval", interval=60,
+                 alarm_times="08:30,12:00,18:00", count=5, sort="최신", keyword="정치, 경제, 사회",
+                 prefetch=2, fetch_multiplier=FETCH_MULTIPLIER, digest_latency=0, keyword_filter="",
+                 messages_file=None, verbose=False):
+        # NewsAutomation.__init__은 Tk 창을 만들므로 호출하지 않고 공통 상태 초기화만 사용
+        self.timeline = timeline
+        self.clock = clock
+        self.verbose = verbose
+        self.init_state()
+
+        self.mode_var = Var(mode)
+        self.interval_var = Var(str(interval))
+        self.alarm_var = Var(alarm_times)
+        self.count_var = Var(str(count))
+        self.sort_var = Var(sort)
+        self.keyword_var = Var(keyword)
+        self.filter_var = Var(keyword_filter)
+        self.prefetch_var = Var(str(prefetch))
+        self.enrich_var = Var(False)
+        self.digest_var = Var(digest_latency > 0)
+        self.digest_latency_var = Var(str(digest_latency))
+
+        self.naver_id = self.naver_secret = "replay"
+        self.access_token = "replay"
+        self.fetch_multiplier = fetch_multiplier
+
+        # 앱의 파일 기록 채널을 가상 시각으로 사용 (messages_file을 지정하지 않으면 전송 내역만 보관)
+        self.sink = StubSink(messages_file, clock=lambda: clock.current.timestamp(), keep_deliveries=True, log=self.log_message)
+        self.dispatcher = SinkDispatcher([self.sink], log=self.log_message)
+        self.sent_history = SentHistory(history_file, key_func=canonical_link, log=self.log_message)
+
+        # 측정값
+        self.api_calls = 0
+        self.jobs = 0
+        self.cpu_seconds = 0.0
+
+    def now(self):
+        return self.clock.current
+
+    def log_message(self, message):
+        if self.verbose:
+            print(f"[{self.clock.current.strftime('%m-%d %H:%M:%S')}] {message}")
+
+    def call_news_api(self, url, headers, params):
+        self.api_calls += 1
+        t = self.clock.current.timestamp()
+        entry = self.timeline.lookup(params["query"], t, params["start"])
+        if entry is None:
+            return ReplayResponse(200, [])
+        if entry["status"] != 200:
+            return ReplayResponse(entry["status"], [])
+
+        # 아직 발행되지 않은 기사는 제외 (기록 시점보다 앞선 가상 시각 대비)
+        items = [item for item in entry["items"] if self.parse_pub_date(item.get("pubDate", "")) <= t]
+        return ReplayResponse(200, items[:params["display"]])
+
+    def get_dispatcher(self):
+        return self.dispatcher
+
+    def update_health_label(self):
+        pass
+
+    def send_news_job(self):
+        started = time.process_time()
+        super().send_news_job()
+        self.cpu_seconds += time.process_time() - started
+        self.jobs += 1
+
+    def prefetch_news(self, run_at):
+        started = time.process_time()
+        super().prefetch_news(run_at)
+        self.cpu_seconds += time.process_time() - started
+
+    def stop_scheduler(self):
+        self.is_running = False
+        schedule.clear()
+        self.flush_digest(force=True)
+
+
+def normalize_title(title):
+    """말머리, 기호, 공백, 대소문자를 무시한 제목 (언론사/링크가 다른 같은 기사 확인용)"""
+    return TITLE_SYMBOL_PATTERN.sub("", TITLE_TAG_PATTERN.sub("", title).lower())
+
+
+def percentile(values, ratio):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * ratio), len(values) - 1)]
+
+
+def simulate(timeline, step=10, start=None, end=None, **settings):
+    """기록된 응답을 가상 시각으로 재생하고 측정값 반환"""
+    start = start or datetime.fromtimestamp(timeline.start)
+    end = end or datetime.fromtimestamp(timeline.end)
+    clock = VirtualClock(start)
+    timeline.fallbacks = {}
+    timeline.missing_pages = {}
+    original_datetime = install_virtual_clock(clock)
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            app = SimulatedNewsAutomation(timeline, clock, os.path.join(temp_dir, "sent_history.txt"), **settings)
+            schedule.clear()
+            app.is_running = True
+            app.schedule_jobs()
+
+            while app.is_running and clock.current < end:
+                clock.advance(step)
+                app.scheduler_tick()
+
+            app.flush_digest(force=True)
+            schedule.clear()
+            app.dispatcher.shutdown()
+    finally:
+        schedule.datetime = original_datetime
+
+    # 측정값 계산
+    # 같은 링크(정규화 키)는 전송 기록으로 이미 걸러지므로, 링크가 다른데 제목이 같은 기사를 재전송으로 집계
+    latencies = []
+    title_keys = {}
+    delivered = duplicates = 0
+    for sent_at, news_list in app.sink.deliveries:
+        for news in news_list:
+            delivered += 1
+            title = normalize_title(news["title"])
+            if title and title_keys.setdefault(title, news["key"]) != news["key"]:
+                duplicates += 1
+            if news.get("pub_ts"):
+                latencies.append(max(sent_at - news["pub_ts"], 0))
+
+    return {
+        "jobs": app.jobs,
+        "messages": len(app.sink.deliveries),
+        "delivered": delivered,
+        "latency_mean": sum(latencies) / len(latencies) if latencies else 0.0,
+        "latency_p95": percentile(latencies, 0.95),
+        "duplicate_rate": duplicates / delivered if delivered else 0.0,
+        "api_calls": app.api_calls,
+        "rejected_calls": sum(breaker.snapshot()["rejected"] for breaker in app.breakers.all()),
+        "fallbacks": dict(timeline.fallbacks),
+        "missing_pages": dict(timeline.missing_pages),
+        "api_per_article": app.api_calls / delivered if delivered else float("inf"),
+        "cpu_ms_per_job": app.cpu_seconds * 1000 / app.jobs if app.jobs else 0.0
+    }
+
+
+def parse_list(text, cast=int):
+    return [cast(value.strip()) for value in text.split(",") if value.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록된 뉴스 응답으로 스케줄 설정 시뮬레이션")
+    parser.add_argument("timeline", help="run.py --record로 기록한 파일")
+    parser.add_argument("--mode", choices=["interval", "alarm"], default="interval")
+    parser.add_argument("--interval", default="60", help="간격(분), 쉼표로 여러 값 비교")
+    parser.add_argument("--count", default="5", help="전송 개수, 쉼표로 여러 값 비교")
+    parser.add_argument("--multiplier", default=str(FETCH_MULTIPLIER), help="요청 개수 대비 가져올 배수, 쉼표로 여러 값 비교")
+    parser.add_argument("--alarm-times", default="08:30,12:00,18:00")
+    parser.add_argument("--sort", choices=["최신", "관련도"], default="최신")
+    parser.add_argument("--keyword", default="정치, 경제, 사회")
+    parser.add_argument("--filter", default="", help="키워드 필터 (예: 경제, +주식, -연예)")
+    parser.add_argument("--prefetch", type=int, default=2, help="미리 가져오기 리드 타임(분)")
+    parser.add_argument("--digest-latency", default="0", help="모아서 전송 최대 대기(분, 0이면 사용 안 함), 쉼표로 여러 값 비교")
+    parser.add_argument("--step", type=int, default=10, help="가상 시각 진행 단위(초)")
+    parser.add_argument("--messages", help="전송 메시지를 기록할 파일 (파일 기록 채널과 같은 형식)")
+    parser.add_argument("--verbose", action="store_true", help="앱 로그 출력")
+    args = parser.parse_args()
+
+    try:
+        timeline = Timeline(args.timeline)
+    except (OSError, ValueError, KeyError) as e:
+        # 파일이 없거나 비어 있거나 형식이 잘못된 경우
+        print(f"기록 파일 오류: {e}")
+        sys.exit(1)
+    print(f"재생 구간: {datetime.fromtimestamp(timeline.start)} ~ {datetime.fromtimestamp(timeline.end)}")
+    print(f"{'간격':>4} {'개수':>4} {'배수':>4} {'대기':>4} | {'작업':>5} {'메시지':>5} {'기사':>5} {'평균지연(분)':>10} {'p95(분)':>8} "
+          f"{'재전송률':>6} {'API/기사':>8} {'차단':>4} {'CPU/작업(ms)':>12}")
+
+    missing = {}
+    missing_pages = {}
+    for interval in parse_list(args.interval):
+        for count in parse_list(args.count):
+            for multiplier in parse_list(args.multiplier):
+                for digest_latency in parse_list(args.digest_latency):
+                    result = simulate(timeline, step=args.step, mode=args.mode, interval=interval,
+                                      alarm_times=args.alarm_times, count=count, sort=args.sort,
+                                      keyword=args.keyword, prefetch=args.prefetch,
+                                      fetch_multiplier=multiplier, digest_latency=digest_latency,
+                                      keyword_filter=args.filter, messages_file=args.messages,
+                                      verbose=args.verbose)
+                    print(f"{interval:>4} {count:>4} {multiplier:>4} {digest_latency:>4} | {result['jobs']:>5} "
+                          f"{result['messages']:>5} {result['delivered']:>5} "
+                          f"{result['latency_mean'] / 60:>10.1f} {result['latency_p95'] / 60:>8.1f} "
+                          f"{result['duplicate_rate'] * 100:>5.1f}% {result['api_per_article']:>8.2f} "
+                          f"{result['rejected_calls']:>4} {result['cpu_ms_per_job']:>12.2f}")
+                    for query, times in result["fallbacks"].items():
+                        missing[query] = missing.get(query, 0) + times
+                    for query, times in result["missing_pages"].items():
+                        missing_pages[query] = missing_pages.get(query, 0) + times
+
+    if missing:
+        # 기록되지 않은 검색어는 다른 검색어 응답으로 재생되어 지연/중복률이 실제와 다를 수 있음
+        print("경고: 기록되지 않은 검색어를 다른 검색어 응답으로 대신 재생함 - "
+              + ", ".join(f"'{query}' {times}회" for query, times in sorted(missing.items())))
+    if missing_pages:
+        # 배수가 커서 기록보다 많은 페이지를 요청한 경우 (추가 페이지의 효과는 측정되지 않음)
+        print("경고: 기록되지 않은 다음 페이지를 빈 페이지로 재생함 - "
+              + ", ".join(f"'{query}' {times}회" for query, times in sorted(missing_pages.items())))
+
+
+if __name__ == "__main__":
+    main()
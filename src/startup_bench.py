@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시작 속도 측정
+- python -X importtime으로 run.py 모듈 로드 시간을 측정
+- 여러 번 측정한 최솟값을 ../config/startup_bench.csv에 누적 기록 (변화 추적용)
+"""
+
+import csv
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+BENCH_FILE = "../config/startup_bench.csv"
+RUNS = 5
+
+
+def measure_import_time(module="run"):
+    """모듈 로드 시간(마이크로초)과 그 모듈이 직접 불러온 모듈별 누적 시간 반환"""
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=src_dir, capture_output=True, text=True)
+
+    # 형식: "import time: self [us] | cumulative | imported package"
+    # 하위 모듈은 들여쓰기로 표시되며 부모보다 먼저 출력됨
+    children = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line.split("|")
+        cumulative_us = int(fields[1])
+        name = fields[2][1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+
+        if depth == 0:
+            if name == module:
+                return cumulative_us, children
+            children = {}
+        elif depth == 1:
+            children[name] = cumulative_us
+    return 0, {}
+
+
+def get_commit():
+    """현재 git 커밋 (없으면 빈 문자열)"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True)
+        return result.stdout.strip()
+    except OSError:
+        return ""
+
+
+def main():
+    best_total, best_detail = None, {}
+    for _ in range(RUNS):
+        total, detail = measure_import_time()
+        if best_total is None or total < best_total:
+            best_total, best_detail = total, detail
+
+    # 직접 불러온 모듈 중 오래 걸린 순으로 5개
+    top_level = sorted(((us, name) for name, us in best_detail.items()), reverse=True)[:5]
+    top_text = ", ".join(f"{name}={us / 1000:.1f}ms" for us, name in top_level)
+
+    print(f"run 모듈 로드: {best_total / 1000:.1f}ms (최소 {RUNS}회 중)")
+    print(f"주요 모듈: {top_text}")
+
+    os.makedirs(os.path.dirname(BENCH_FILE), exist_ok=True)
+    is_new = not os.path.exists(BENCH_FILE)
+    with open(BENCH_FILE, 'a', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        if is_new:
+            writer.writerow(["timestamp", "commit", "run_import_ms", "top_modules"])
+        writer.writerow([datetime.now().isoformat(timespec="seconds"), get_commit(),
+                         f"{best_total / 1000:.1f}", top_text])
+
+
+if __name__ == "__main__":
+    main()